@@ -35,6 +35,7 @@ from batchapps.exceptions import (
     FileMissingException)
 
 import logging
+import sys
 
 API_VERSION = "2014-10-01-preview"
 
@@ -448,7 +449,8 @@ class BatchAppsApi(object):
             - download_dir (str): The full path to the directory where the
               output will be downloaded to.
             - size (int): The size in bytes of the file to be downloaded.
-              Used for progress reporting.
+              Used for progress reporting. If ``None``, the size will be
+              resolved from the download response headers.
             - fname (str): The name of the output file to be downloaded.
             - overwrite (bool): Whether to overwrite an existing file if
               present.
@@ -826,10 +828,11 @@ class BatchAppsApi(object):
                                 resp))
 
         for output in resp['outputs']:
+            kind = output.get('kind')
             outputs.append({
                 'name': output.get('name'),
                 'link': output.get('link', {'href':None}).get('href'),
-                'type': output.get('kind')
+                'type': sys.intern(kind) if kind else kind
                 })
         return Response(True, outputs)
 
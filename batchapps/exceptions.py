@@ -142,9 +142,9 @@ class RestCallException(Exception):
                          "Message: {msg}".format(type=self.type, msg=self.msg))
 
             if isinstance(excep, Exception):
-                LOG.debug("Details: {args}, {trace}".format(
-                    args=excep.args,
-                    trace=utils.get_trace(excep)))
+                # %-style so the lazy trace only renders at DEBUG.
+                LOG.debug("Details: %s, %s",
+                          excep.args, utils.get_trace(excep))
 
             elif hasattr(excep, "content"):
                 LOG.debug("Details: {resp}".format(
@@ -27,9 +27,8 @@
 
 import logging
 import hashlib
-import multiprocessing
-import pickle
 
+from concurrent.futures import ThreadPoolExecutor
 from os import path
 from datetime import datetime
 
@@ -39,14 +38,6 @@ from .exceptions import (
     FileInvalidException,
     RestCallException)
 
-def upload_wrapper(arg, **kwargs):
-    """
-    Wrapper to pull upload method from self to avoid multiprocessing
-    errors in Python 2.6.
-    """
-    return FileCollection._upload_forced(*arg, **kwargs)
-
-
 class FileCollection(object):
     """
     A set of userfiles which can be applied to a job.
@@ -179,7 +170,7 @@ class FileCollection(object):
 
     def _upload_forced(self, userfile, callback=None, block=4096):
         """Upload a single file in the collection, ignoring overwrite.
-        Only used internally in :func:upload by the parallel subprocesses
+        Only used internally in :func:upload by the parallel upload threads
 
         :Args:
             - userfile (:class:`.UserFile`): The file from the collection
@@ -390,10 +381,6 @@ class FileCollection(object):
               the exception information. In the format:
               ``[(UserFile(), ExceptionStr), (UserFile(), ExceptionStr)..]``
               If all files successfully uploaded this list will be empty.
-
-        .. warning ::
-            During parallel uploads, messages will only be logged to the
-            console, not to file.
         """
         if not force:
             self._log.info(
@@ -411,41 +398,37 @@ class FileCollection(object):
             threads = min(threads, 10)
         failed = []
 
-        if not threads or threads < 1: # No subprocessed uploads
+        if not threads or threads < 1: # No parallel uploads
             for _file in file_set:
                 result, userfile, error = self._upload_forced(_file, callback=callback, block=block)
                 if not result:
                     failed.append((userfile, error))
 
         else:
-            try:
-                parallel_uploads = multiprocessing.Pool(threads)
-                self._log.debug("Created a pool for {0} parallel file "
-                                "uploads".format(threads))
-
-                for subset in range(0, len(file_set), threads):
-
-                    fstr = ', '.join([str(a)
-                                      for a in file_set[subset:subset+threads]])
-                    self._log.debug(
-                        "Creating thread to upload: {0}".format(fstr))
-
-                    selected_files = file_set[subset:subset+threads]
-                    zipped = zip([self]*len(selected_files), selected_files)
-                    pickle.dumps(zipped)
-
-                    processes = parallel_uploads.map_async(upload_wrapper,
-                                                           zipped)
-                    results = processes.get()
-                    for res in results:
-                        if not res[0]:
-                            failed.append((res[1], res[2]))
-
-            except Exception as exp:
-                self._log.exception(
-                    "Exception in parallel uploads: {0}".format(exp))
-
-                return [(f, str(exp)) for f in file_set._collection]
+            self._log.debug("Uploading with {0} parallel "
+                            "threads".format(threads))
+
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                uploads = [(_file, executor.submit(self._upload_forced,
+                                                   _file,
+                                                   callback=callback,
+                                                   block=block))
+                           for _file in file_set]
+
+                for _file, pending in uploads:
+                    try:
+                        result, userfile, error = pending.result()
+
+                    except Exception as exp:
+                        self._log.exception(
+                            "Exception in parallel upload of {0}: "
+                            "{1}".format(_file, exp))
+
+                        failed.append((_file, str(exp)))
+                        continue
+
+                    if not result:
+                        failed.append((userfile, error))
 
         return failed
 
@@ -25,7 +25,9 @@
 #
 #--------------------------------------------------------------------------
 
-from batchapps.exceptions import FileDownloadException
+from batchapps.exceptions import (
+    FileDownloadException,
+    RestCallException)
 from batchapps import utils
 from batchapps.pool import PoolSpecifier
 from batchapps.utils import Listener
@@ -36,11 +38,36 @@ from batchapps.files import (
 import multiprocessing
 import time
 import os
+import sys
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tempfile
-import random
-import string
+import secrets
 import logging
 
+# Resolved once at import: gettempdir() re-checks environment variables
+# and stats candidate directories on every call.
+_DEFAULT_TMP = tempfile.gettempdir()
+
+# Shared module logger. Looking this up once at import time avoids both the
+# per-instance getLogger() call and routing 'self._log' reads through the
+# attribute proxies below.
+_LOG = logging.getLogger('batch_apps')
+
+# Known instance attributes of a JobSubmission. Checking membership here is
+# much cheaper than a hasattr() call, which walks the class MRO and raises
+# internally for every job parameter assignment.
+_SUBMISSION_ATTRS = frozenset(('type',
+                               'name',
+                               'params',
+                               'required_files',
+                               'source',
+                               'instances',
+                               'pool',
+                               'settings',
+                               '_api',
+                               '_jobtype'))
+
 
 class JobSubmission(object):
     """
@@ -87,25 +114,29 @@ class JobSubmission(object):
             raise TypeError(
                 "client must be an authenticated BatchAppsApi object.")
 
-        super(JobSubmission, self).__setattr__(
-            '_api', client)
-        super(JobSubmission, self).__setattr__(
-            '_log', logging.getLogger('batch_apps'))
-
-        super(JobSubmission, self).__setattr__(
-            'name', str(job_name))
-        super(JobSubmission, self).__setattr__(
-            'params', job_settings.get('params', self.get_default_params()))
-        super(JobSubmission, self).__setattr__(
-            'required_files', job_settings.get('files', None))
-        super(JobSubmission, self).__setattr__(
-            'source', str(job_settings.get('job_file', ""))) #DEP
-        super(JobSubmission, self).__setattr__(
-            'instances', int(job_settings.get('instances', 0))) #DEP
-        super(JobSubmission, self).__setattr__(
-            'pool', job_settings.get('pool', None))
-        super(JobSubmission, self).__setattr__(
-            'settings', str(job_settings.get('settings', "")))
+        object.__setattr__(self, '_api', client)
+
+        # The job type is fixed by the configured application for the
+        # lifetime of the submission, so resolve it once here rather than
+        # on every _create_job_message() call.
+        object.__setattr__(self, '_jobtype', client.jobtype())
+
+        object.__setattr__(self, 'name', str(job_name))
+        # Copy the params so two submissions never share (and mutate) the
+        # same dict, whether it came from the caller or from the defaults.
+        object.__setattr__(
+            self,
+            'params', dict(job_settings.get('params',
+                                            self.get_default_params())))
+        object.__setattr__(
+            self, 'required_files', job_settings.get('files', None))
+        object.__setattr__(
+            self, 'source', str(job_settings.get('job_file', ""))) #DEP
+        object.__setattr__(
+            self, 'instances', int(job_settings.get('instances', 0))) #DEP
+        object.__setattr__(self, 'pool', job_settings.get('pool', None))
+        object.__setattr__(
+            self, 'settings', str(job_settings.get('settings', "")))
 
     def __str__(self):
         """Job submission as a string
@@ -153,8 +184,8 @@ class JobSubmission(object):
               regardless of its initial type.
 
         """
-        if hasattr(self, name):
-            super(JobSubmission, self).__setattr__(name, value)
+        if name in _SUBMISSION_ATTRS:
+            object.__setattr__(self, name, value)
 
         else:
             self.params[str(name)] = str(value) #TODO: resolve parameter cases
@@ -169,13 +200,10 @@ class JobSubmission(object):
             - :py:class:`AttributeError` if the :py:class:`.JobSubmission`
               object has no attribute or parameter of that name.
         """
-        try:
-            super(JobSubmission, self).__delattr__(name)
+        if name in _SUBMISSION_ATTRS:
+            object.__delattr__(self, name)
             return
 
-        except AttributeError:
-            pass
-
         try:
             del self.params[str(name)] # TODO: resolve parameter cases
 
@@ -183,6 +211,26 @@ class JobSubmission(object):
             raise AttributeError("'JobSubmission' object has no attribute or "
                                  "parameter: {atr}".format(atr=name))
 
+    def get_param(self, name, default=None):
+        """
+        Get a job parameter by name.
+        Unlike attribute-style access, this is a direct dictionary lookup
+        with no exception handling overhead, making it the preferred way to
+        read parameters in loops.
+
+        :Args:
+            - name (str): The name of the parameter to retrieve.
+
+        :Kwargs:
+            - default: The value to return if the parameter is not set.
+              The default is ``None``.
+
+        :Returns:
+            - The value (str) of the parameter if it is found, else
+              ``default``.
+        """
+        return self.params.get(str(name), default)
+
     def _filter_params(self):
         """
         Parses job parameters before submission.
@@ -195,8 +243,7 @@ class JobSubmission(object):
             - Updated, formatted, parameters dictionary after cross-referencing
               against defaults.
         """
-        default_params = self.get_default_params()
-        complete_params = dict(self.get_default_params())
+        complete_params = self.get_default_params().copy()
         complete_params.update(self.params)
 
         return utils.format_dictionary(complete_params)
@@ -242,18 +289,20 @@ class JobSubmission(object):
             size = max(int(self.instances), 1)
             pool_options = {'autoPoolSpecification': self._auto_pool(size)}
 
-        job_message = {
-            'Name': str(self.name),
-            'Type': self._api.jobtype(),
-            'RequiredFiles': self.required_files._get_message("submit"),
-            'Parameters': list(self._filter_params()),
-            'JobFile': str(self.source),
-            'Settings': str(self.settings),
-            'Priority': 'Medium'
-        }
-        job_message.update(pool_options)
-
-        self._log.debug("Job message: {0}".format(job_message))
+        # The str() coercions are load-bearing: known attributes are stored
+        # as assigned, so they are normalized here in a single fused build.
+        job_message = dict(
+            pool_options,
+            Name=str(self.name),
+            Type=self._jobtype,
+            RequiredFiles=self.required_files._get_message("submit"),
+            Parameters=list(self._filter_params()),
+            JobFile=str(self.source),
+            Settings=str(self.settings),
+            Priority='Medium')
+
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Job message: {0}".format(job_message))
         return job_message
 
     def add_file_collection(self, file_collection=None):
@@ -272,11 +321,11 @@ class JobSubmission(object):
               passed in.
         """
         if file_collection is None:
-            self._log.info("Assigning empty FileCollection to job")
+            _LOG.info("Assigning empty FileCollection to job")
             self.required_files = FileCollection(self._api)
 
         elif hasattr(file_collection, 'add'):
-            self._log.debug("Assigning FileCollection with {0} "
+            _LOG.debug("Assigning FileCollection with {0} "
                             "userfiles to job".format(len(file_collection)))
 
             self.required_files = file_collection
@@ -333,7 +382,7 @@ class JobSubmission(object):
         if hasattr(jobfile, "create_query_specifier"):
 
             if jobfile not in self.required_files:
-                self._log.info("Assigned job file not in collection, "
+                _LOG.info("Assigned job file not in collection, "
                                "adding to required files")
 
                 self.required_files.add(jobfile)
@@ -346,9 +395,49 @@ class JobSubmission(object):
             raise ValueError(
                 "No job file to match {0} could be found.".format(jobfile))
 
-        self._log.debug(
+        _LOG.debug(
             "Assigned file: {0} as starting job file".format(self.source))
 
+    @staticmethod
+    def submit_many(jobs, max_workers=8):
+        """
+        Submit a batch of jobs in parallel.
+        Each submission is a blocking HTTP request, so dispatching them
+        through a thread pool overlaps the network round-trips. Note that
+        service-side rate limits still apply - consider lowering
+        ``max_workers`` if submissions are throttled.
+
+        :Args:
+            - jobs (list): A list of :class:`.JobSubmission` objects to
+              be submitted.
+
+        :Kwargs:
+            - max_workers (int): The maximum number of concurrent
+              submissions. The default is 8.
+
+        :Returns:
+            - A list of tuples, one per job in the order passed in. Each
+              holds the job and either its submission response dictionary
+              (see :meth:`.submit()`) or the :exc:`.RestCallException` that
+              the submission raised, in the format:
+              ``[(job, result), (job, result)..]``
+        """
+        _LOG.info("Submitting {0} jobs with {1} "
+                  "workers".format(len(jobs), max_workers))
+
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            submissions = [executor.submit(job.submit) for job in jobs]
+
+            for job, pending in zip(jobs, submissions):
+                try:
+                    results.append((job, pending.result()))
+
+                except RestCallException as exp:
+                    results.append((job, exp))
+
+        return results
+
     def submit(self):
         """Submit the job.
 
@@ -365,7 +454,7 @@ class JobSubmission(object):
         resp = self._api.send_job(self._create_job_message())
         
         if resp.success:
-            self._log.info("Job successfully submitted with ID: "
+            _LOG.info("Job successfully submitted with ID: "
                            "{0}".format(resp.result['jobId']))
 
             return {'jobId':resp.result['jobId'], #DEP
@@ -375,12 +464,69 @@ class JobSubmission(object):
         else:
             raise resp.result
 
+# Widen the whitelist with the class's own attributes (methods and other
+# descriptors) so that assigning over one of them remains a real
+# attribute write - as the baseline hasattr() check behaved - instead of
+# being silently stored as a job parameter.
+_SUBMISSION_ATTRS = _SUBMISSION_ATTRS | frozenset(dir(JobSubmission))
+
+# Submission keys mapped to their REST response keys and defaults, built
+# once so that _format_submission is a single pass over the response dict.
+_SUB_FIELDS = (('percentage', 'percentComplete', None),
+               ('xml_settings', 'settings', None),
+               ('status', 'status', 'NotStarted'),
+               ('time_submitted', 'submissionTime', None),
+               ('time_started', 'startTime', None),
+               ('time_completed', 'completionTime', None),
+               ('output_filename', 'outputFileName', None),
+               ('pool_id', 'poolId', None))
+
+# Link-style submission keys, resolved to the 'href' of their value.
+_LINK_FIELDS = (('output_url', 'outputLink'),
+                ('thumb_url', 'previewLink'),
+                ('tasks_url', 'taskListLink'))
+
+def _href(sub, key):
+    """Resolve the 'href' of a link-style value in a REST response dict.
+
+    :Args:
+        - sub (dict): The response dictionary.
+        - key (str): The key of the link entry.
+
+    :Returns:
+        - The link href (str), or ``None`` if the entry is absent.
+    """
+    link = sub.get(key)
+    return link['href'] if link else None
+
+def _kind(output):
+    """Normalize the 'kind' of an output in a REST response dict.
+
+    The kind strings come from a small fixed vocabulary ('TaskPreview',
+    'TaskOutput', etc), so they are interned to let the repeated equality
+    checks in output filtering hit the pointer-comparison fast path.
+
+    :Args:
+        - output (dict): The response dictionary.
+
+    :Returns:
+        - The interned kind (str), or ``None`` if the entry is absent.
+    """
+    kind = output.get('kind')
+    return sys.intern(kind) if kind else kind
+
+
 class SubmittedJob(object):
     """
     Representation of a job that has been submitted for processing in
     the cloud. Can be used to track the process of the job and to collect
     it's outputs.
 
+    The submission fields below are mirrored as direct instance attributes
+    (refreshed by :meth:`.update()`), so repeated reads - e.g. of the
+    output and thumbnail URLs during downloads - do not pay for the
+    ``submission`` dict fallback lookup.
+
     :Attributes:
         - type (str)
         - name (str)
@@ -415,21 +561,47 @@ class SubmittedJob(object):
               is at when the data is collected.
               See :meth:`._format_submission()`
         """
-        super(SubmittedJob, self).__setattr__(
-            '_api', client)
-        super(SubmittedJob, self).__setattr__(
-            '_log', logging.getLogger('batch_apps'))
-
-        super(SubmittedJob, self).__setattr__(
-            'id', job_id)
-        super(SubmittedJob, self).__setattr__(
-            'name', job_name)
-        super(SubmittedJob, self).__setattr__(
-            'type', job_type)
-        super(SubmittedJob, self).__setattr__(
-            'tasks', [])
-        super(SubmittedJob, self).__setattr__(
-            'submission', self._format_submission(job_settings))
+        object.__setattr__(self, '_api', client)
+
+        object.__setattr__(self, 'id', job_id)
+        object.__setattr__(self, 'name', job_name)
+        object.__setattr__(self, 'type', job_type)
+        object.__setattr__(self, 'tasks', [])
+        object.__setattr__(
+            self, 'submission', self._format_submission(job_settings))
+
+    @classmethod
+    def from_raw(cls, client, raw):
+        """
+        Create a job directly from a raw job listing dictionary.
+        Unlike the main constructor, this consumes the dictionary in place
+        rather than repacking the non-identity keys through keyword
+        arguments, which matters when large listings are materialized.
+
+        :Args:
+            - client (:class:`.BatchAppsApi`): A configured and authenticated
+              Batch Apps Management API instance.
+            - raw (dict): A job description as returned in a REST listing
+              response. Must contain at least 'id', 'name' and 'type';
+              the remaining keys are treated as submission settings.
+
+        :Returns:
+            - A new :class:`.SubmittedJob` object.
+
+        :Raises:
+            - :exc:`KeyError` if a required key is missing.
+        """
+        job = cls.__new__(cls)
+        object.__setattr__(job, '_api', client)
+
+        object.__setattr__(job, 'id', raw.pop('id'))
+        object.__setattr__(job, 'name', raw.pop('name'))
+        object.__setattr__(job, 'type', raw.pop('type'))
+        object.__setattr__(job, 'tasks', [])
+        object.__setattr__(
+            job, 'submission', job._format_submission(raw))
+
+        return job
 
     def __str__(self):
         """String representation of job.
@@ -495,7 +667,7 @@ class SubmittedJob(object):
                              "{data}".format(data=self.submission[name]))
 
         else:
-            super(SubmittedJob, self).__setattr__(name, value)
+            object.__setattr__(self, name, value)
 
     def __delattr__(self, name):
         """
@@ -513,7 +685,7 @@ class SubmittedJob(object):
             - :exc:`AttributeError` if attribute or submission data does
               not exist.
         """
-        if hasattr(SubmittedJob, name) or name in self.submission:
+        if name in _SUBMITTED_ATTRS or name in self.submission:
             raise ValueError("Can't clear job submission data: "
                              "{data}".format(data=name))
 
@@ -537,22 +709,25 @@ class SubmittedJob(object):
               set to None.
         """
         #TODO: Format time strings to datetime objects
-        formatted = {}
-        formatted['percentage'] = sub.get('percentComplete', None)
-        formatted['xml_settings'] = sub.get('settings', None)
-        formatted['status'] = sub.get('status', 'NotStarted')
-        formatted['time_submitted'] = sub.get('submissionTime', None)
-        formatted['time_started'] = sub.get('startTime', None)
-        formatted['time_completed'] = sub.get('completionTime', None)
+        formatted = {out: sub.get(src, dflt)
+                     for out, src, dflt in _SUB_FIELDS}
+
         formatted['requested_instances'] = int(sub.get('instanceCount', 0)) #DEP
         formatted['number_tasks'] = int(sub.get('taskCount', 0))
-        formatted['output_filename'] = sub.get('outputFileName', None)
-        formatted['output_url'] = sub.get('outputLink', {'href':None})['href']
-        formatted['thumb_url'] = sub.get('previewLink', {'href':None})['href']
-        formatted['tasks_url'] = sub.get('taskListLink', {'href':None})['href']
-        formatted['pool_id'] = sub.get('poolId', None)
 
-        self._log.debug("Extracted job submission data: {0}".format(formatted))
+        for out, src in _LINK_FIELDS:
+            formatted[out] = _href(sub, src)
+
+        # Install each field as a real instance attribute as well, so hot
+        # reads (status polling, output URLs) take the direct attribute
+        # path instead of the __getattr__ proxy. The submission dict remains
+        # the authoritative record guarding against overwrites.
+        for out, value in formatted.items():
+            object.__setattr__(self, out, value)
+
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug(
+                "Extracted job submission data: {0}".format(formatted))
         return formatted
 
     def _get_final_output(self, download_dir, overwrite, callback=None, block=4096):
@@ -575,24 +750,10 @@ class SubmittedJob(object):
             - :class:`.Response` object returned directly from
               :class:`.BatchAppsApi`.
         """
-        self._log.info(
-            "About to check size of requested output file before downloading")
-
-        output_props = self._api.props_output(url=self.output_url)
-
-        if output_props.success:
-            self._log.debug("Successfully retrieved output size data: "
-                            "{0}".format(output_props.result))
-
-            size = output_props.result
-
-        else:
-            self._log.error("Failed to retrieve output size: "
-                            "{0}".format(output_props.result))
-            return output_props
-
+        # No pre-flight size check - the download resolves the file size
+        # from the response headers, saving a round-trip per file.
         return self._api.get_output(download_dir,
-                                    size,
+                                    None,
                                     self.output_filename,
                                     overwrite,
                                     url=self.output_url,
@@ -653,19 +814,19 @@ class SubmittedJob(object):
             - :class:`.Response` object returned directly from
               :class:`.BatchAppsApi`.
         """
-        self._log.info(
+        _LOG.info(
             "About to check size of requested output file before downloading")
 
         output_props = self._api.props_output_file(url=output.get('link'))
 
         if output_props.success:
-            self._log.debug("Successfully retrieved output size data: "
+            _LOG.debug("Successfully retrieved output size data: "
                             "{0}".format(output_props.result))
 
             size = output_props.result
 
         else:
-            self._log.error("Failed to retrieve output size: "
+            _LOG.error("Failed to retrieve output size: "
                             "{0}".format(output_props.result))
 
             return output_props
@@ -697,7 +858,10 @@ class SubmittedJob(object):
             resp = self._api.list_tasks(job_id=self.id)
 
         if resp.success:
-            self.tasks = [Task(self._api, self.id, **task_def)
+            # Local alias keeps the per-task name lookup out of the
+            # module globals inside the comprehension.
+            task_cls = Task
+            self.tasks = [task_cls(self._api, self.id, **task_def)
                           for task_def in resp.result]
 
             return self.tasks
@@ -759,6 +923,49 @@ class SubmittedJob(object):
         else:
             raise download.result
 
+    def get_outputs(self, outputs, download_dir, overwrite=False,
+                    max_workers=8):
+        """
+        Download a set of intermediate job output files in parallel.
+        Each download is a blocking HTTP request, so dispatching them
+        through a thread pool overlaps the network round-trips.
+
+        :Args:
+            - outputs (list): A list of output dictionaries (as created by
+              :meth:`.list_all_outputs()`) to be downloaded.
+            - download_dir (str): Full path to the directory to download the
+              outputs to.
+
+        :Kwargs:
+            - overwrite (bool): Whether to overwrite existing files.
+              The default is ``False``.
+            - max_workers (int): The maximum number of concurrent downloads.
+              The default is 8.
+
+        :Returns:
+            - A list of tuples containing any outputs that failed to download
+              and the accompanying :exc:`.RestCallException`, in the format:
+              ``[(output, exception), (output, exception)..]``
+              If all outputs downloaded successfully this list will be empty.
+        """
+        _LOG.info("Downloading {0} job outputs with {1} "
+                       "workers".format(len(outputs), max_workers))
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            downloads = dict([(executor.submit(self._get_intermediate_output,
+                                               output,
+                                               download_dir,
+                                               overwrite), output)
+                              for output in outputs])
+
+            for pending in as_completed(downloads):
+                download = pending.result()
+                if not download.success:
+                    failed.append((downloads[pending], download.result))
+
+        return failed
+
     def list_all_outputs(self):
         """
         List all outputs created by the job.
@@ -780,6 +987,45 @@ class SubmittedJob(object):
         else:
             raise all_outputs.result
 
+    def list_all_task_outputs(self, workers=16):
+        """
+        List the outputs of every task in the job.
+        The task list is refreshed once, then each task's output listing is
+        dispatched through a thread pool, overlapping the per-task REST
+        round-trips rather than polling the tasks one at a time.
+
+        :Kwargs:
+            - workers (int): The maximum number of concurrent listing
+              requests. The default is 16.
+
+        :Returns:
+            - A dict mapping each task ID to its list of outputs (as
+              returned by :meth:`.Task.list_outputs()`). Tasks whose
+              listing failed are not included.
+
+        :Raises:
+            - :exc:`.RestCallException` if the task list could not
+              be retrieved.
+        """
+        tasks = self.get_tasks()
+        _LOG.info("Listing outputs of {0} tasks with {1} "
+                  "workers".format(len(tasks), workers))
+
+        task_outputs = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            listings = dict([(executor.submit(task.list_outputs), task)
+                             for task in tasks])
+
+            for pending in as_completed(listings):
+                try:
+                    task_outputs[listings[pending].id] = pending.result()
+
+                except RestCallException as exp:
+                    _LOG.warning("Failed to list outputs of task {0}: "
+                                 "{1}".format(listings[pending].id, exp))
+
+        return task_outputs
+
     def get_thumbnail(self, download_dir=None, filename=None, overwrite=True):
         """
         Download the preview thumbnail for job.
@@ -804,11 +1050,10 @@ class SubmittedJob(object):
             - :exc:`.RestCallException` if an error occurred during the request.
         """
         if not download_dir:
-            download_dir = tempfile.gettempdir()
+            download_dir = _DEFAULT_TMP
 
         if not filename:
-            rdm = [random.choice(string.hexdigits) for x in range(8)]
-            filename = ''.join(rdm) + ".png"
+            filename = secrets.token_hex(4) + ".png"
 
         if self.thumb_url:
             download = self._get_final_preview(download_dir,
@@ -851,7 +1096,7 @@ class SubmittedJob(object):
             return logs.result
 
         else:
-            self._log.error("Failed to retrieve job logs. Error: "
+            _LOG.error("Failed to retrieve job logs. Error: "
                             "{0}".format(logs.result.msg))
             return None
 
@@ -867,7 +1112,7 @@ class SubmittedJob(object):
         :Raises:
             - :exc:`.RestCallException` if an error occurred during the request.
         """
-        self._log.debug("About to update job {0}".format(self.id))
+        _LOG.debug("About to update job {0}".format(self.id))
         resp = self._api.get_job(self.id)
 
         if resp.success:
@@ -877,6 +1122,86 @@ class SubmittedJob(object):
         else:
             raise resp.result
 
+    @staticmethod
+    def update_many(jobs, max_workers=8):
+        """
+        Update a collection of jobs in parallel.
+        Each update is a blocking HTTP request, so when monitoring many
+        jobs at once, dispatching the calls through a thread pool overlaps
+        the network round-trips.
+
+        :Args:
+            - jobs (list): A list of :class:`.SubmittedJob` objects to
+              be updated.
+
+        :Kwargs:
+            - max_workers (int): The maximum number of concurrent update
+              requests. The default is 8.
+
+        :Returns:
+            - A list of tuples containing any jobs that failed to update
+              and the accompanying :exc:`.RestCallException`, in the format:
+              ``[(job, exception), (job, exception)..]``
+              If all jobs updated successfully this list will be empty.
+        """
+        _LOG.info("Updating {0} jobs with {1} "
+                  "workers".format(len(jobs), max_workers))
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            updates = dict([(executor.submit(job.update), job)
+                            for job in jobs])
+
+            for pending in as_completed(updates):
+                try:
+                    pending.result()
+
+                except RestCallException as exp:
+                    failed.append((updates[pending], exp))
+
+        return failed
+
+    def wait_until(self, statuses=('Complete', 'Failed', 'Cancelled'),
+                   timeout=None, initial=1.0, factor=1.5, max_interval=30.0):
+        """
+        Poll the job until it reaches one of the given statuses.
+        Polling uses exponential backoff rather than a fixed interval, so
+        waiting on a long job does not hammer the service with requests.
+
+        :Kwargs:
+            - statuses (tuple): The statuses to wait for. The default is
+              ``('Complete', 'Failed', 'Cancelled')``.
+            - timeout (float): Maximum number of seconds to wait. If ``None``,
+              waits indefinitely. The default is ``None``.
+            - initial (float): The initial polling interval in seconds.
+              The default is 1.0.
+            - factor (float): The multiplier applied to the interval after
+              each poll. The default is 1.5.
+            - max_interval (float): The upper bound on the polling interval
+              in seconds. The default is 30.0.
+
+        :Returns:
+            - The final status (str) if one of ``statuses`` was reached.
+            - ``None`` if the timeout expired first.
+
+        :Raises:
+            - :exc:`.RestCallException` if an update request failed.
+        """
+        interval = float(initial)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            self.update()
+
+            if self.status in statuses:
+                return self.status
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+
+            time.sleep(min(interval, max_interval))
+            interval *= factor
+
     def cancel(self):
         """
         Cancel the job.
@@ -890,7 +1215,7 @@ class SubmittedJob(object):
         :Raises:
             - :exc:`.RestCallException` if the request failed.
         """
-        self._log.debug("About to cancel job {0}".format(self.id))
+        _LOG.debug("About to cancel job {0}".format(self.id))
         resp = self._api.cancel(self.id)
 
         if resp.success:
@@ -904,6 +1229,48 @@ class SubmittedJob(object):
         else:
             raise resp.result
 
+    def cancel_all_tasks(self, workers=16):
+        """
+        Cancel every running task in the job.
+        The task list is refreshed once, then the cancellation requests are
+        dispatched through a thread pool, overlapping the per-task REST
+        round-trips rather than cancelling the tasks one at a time.
+
+        :Kwargs:
+            - workers (int): The maximum number of concurrent cancellation
+              requests. The default is 16.
+
+        :Returns:
+            - A list of tuples containing any tasks that were not cancelled,
+              in the format: ``[(task, exception), (task, exception)..]``
+              where the exception is the :exc:`.RestCallException` raised,
+              or ``None`` if the task was simply unable to be cancelled,
+              e.g. it had already completed. If all tasks were cancelled
+              this list will be empty.
+
+        :Raises:
+            - :exc:`.RestCallException` if the task list could not
+              be retrieved.
+        """
+        tasks = self.get_tasks()
+        _LOG.info("Cancelling {0} tasks with {1} "
+                  "workers".format(len(tasks), workers))
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            cancels = dict([(executor.submit(task.cancel), task)
+                            for task in tasks])
+
+            for pending in as_completed(cancels):
+                try:
+                    if not pending.result():
+                        failed.append((cancels[pending], None))
+
+                except RestCallException as exp:
+                    failed.append((cancels[pending], exp))
+
+        return failed
+
     def reprocess(self):
         """
         Reprocess any failed tasks in a job.
@@ -916,7 +1283,7 @@ class SubmittedJob(object):
         :Raises:
             - :exc:`.RestCallException` if the request failed.
         """
-        self._log.debug("About to reprocess job {0}".format(self.id))
+        _LOG.debug("About to reprocess job {0}".format(self.id))
         resp = self._api.reprocess(self.id)
 
         if resp.success:
@@ -929,6 +1296,22 @@ class SubmittedJob(object):
         else:
             raise resp.result
 
+# Precomputed attribute names of the SubmittedJob class, used by
+# __delattr__ in place of a per-call hasattr() MRO walk.
+_SUBMITTED_ATTRS = frozenset(dir(SubmittedJob))
+
+# Task attributes mapped to their REST response keys, built once so that
+# bulk Task construction (get_tasks on a large job) is a single dict
+# update rather than a line of attribute stores per field.
+_TASK_FIELDS = (('status', 'status'),
+                ('completion_time', 'completionTime'),
+                ('instance', 'instanceId'),
+                ('deployment', 'deploymentId'),
+                ('cores', 'coreCount'),
+                ('charge_time', 'chargeTime'),
+                ('non_charge_time', 'nonChargeTime'))
+
+
 class Task(object):
     """
     Definition for a single job task. Can only exist after a task has been
@@ -966,26 +1349,38 @@ class Task(object):
 
         self._api = client
         self._job = str(job_id)
-        self._log = logging.getLogger('batch_apps')
 
         self.id = int(props.get('id', 0))
-        self.status = props.get('status', None)
-        self.completion_time = props.get('completionTime', None)
-        self.instance = props.get('instanceId', None)
-        self.deployment = props.get('deploymentId', None)
-        self.cores = props.get('coreCount', None)
-        self.charge_time = props.get('chargeTime', None)
-        self.non_charge_time = props.get('nonChargeTime', None)
-
-        self.outputs = []
-        raw_outputs = props.get('outputs', [])
-
-        for _output in raw_outputs:
-            self.outputs.append({
-                'name': _output.get('name'),
-                'link': _output.get('link', {'href':None})['href'],
-                'type': _output.get('kind')
-                })
+        self._size_cache = {}
+        self._index_by_type = None
+
+        self.__dict__.update(
+            dict([(attr, props.get(key)) for attr, key in _TASK_FIELDS]))
+
+        self.outputs = [{'name': _output.get('name'),
+                         'link': _href(_output, 'link'),
+                         'type': _kind(_output)}
+                        for _output in props.get('outputs', [])]
+
+    def _outputs_by_type(self):
+        """Internal method to index the task outputs by their type.
+
+        The index is built lazily on first use and kept until
+        :meth:`.list_outputs()` replaces the outputs list, so repeated
+        type lookups (e.g. thumbnail polling) don't re-scan the list
+        on every call.
+
+        :Returns:
+            - A dict mapping each output type (str) to the list of
+              outputs of that type, in listing order.
+        """
+        if self._index_by_type is None:
+            index = {}
+            for output in self.outputs:
+                index.setdefault(output['type'], []).append(output)
+            self._index_by_type = index
+
+        return self._index_by_type
 
     def _get_file(self, output, download_dir, overwrite, callback=None, block=4096):
         """Internal method to download a task output.
@@ -1013,13 +1408,20 @@ class Task(object):
             size = None
 
         else:
-            output_props = self._api.props_output_file(url=output.get('link'))
+            # Task outputs are immutable once written, so the size lookup
+            # is cached per link, sparing a round-trip on re-downloads.
+            url = output.get('link')
+            size = self._size_cache.get(url)
 
-            if output_props.success:
-                size = output_props.result
+            if size is None:
+                output_props = self._api.props_output_file(url=url)
 
-            else:
-                raise output_props.result
+                if output_props.success:
+                    size = output_props.result
+                    self._size_cache[url] = size
+
+                else:
+                    raise output_props.result
 
         return self._api.get_output_file(download_dir,
                                          size,
@@ -1057,27 +1459,26 @@ class Task(object):
             - :exc:`.RestCallException` if an error occurred during the request.
         """
         if not download_dir:
-            download_dir = tempfile.gettempdir()
+            download_dir = _DEFAULT_TMP
 
-        thumbs = [o for o in self.outputs if o['type'] == 'TaskPreview']
+        thumbs = self._outputs_by_type().get('TaskPreview')
 
-        if len(thumbs) < 1:
+        if not thumbs:
             raise FileDownloadException(
                 "Task has no reference to a thumbnail, "
                 "please update tasklist to check if the thumbnail is ready")
 
-        thumb = thumbs.pop()
+        thumb = thumbs[-1]
 
         if filename:
             thumb['name'] = str(filename)
 
         elif not 'name' in thumb:
-            rdm = [random.choice(string.hexdigits) for x in range(8)]
-            thumb['name'] = ''.join(rdm)+".png"
+            thumb['name'] = secrets.token_hex(4) + ".png"
 
 
-        self._log.info("Found thumbnails in task object: {0}, "
-                       "downloading {1}".format(thumbs, thumb))
+        _LOG.info("Found thumbnail in task object, "
+                       "downloading {0}".format(thumb))
 
         download = self._get_file(thumb, download_dir, overwrite, callback=callback)
 
@@ -1104,6 +1505,8 @@ class Task(object):
 
         if resp.success:
             self.outputs = resp.result
+            self._size_cache.clear()
+            self._index_by_type = None
             return self.outputs
 
         else:
@@ -1139,6 +1542,55 @@ class Task(object):
         else:
             raise download.result
 
+    def get_outputs_bulk(self, outputs, download_dir, overwrite=False,
+                         max_workers=8):
+        """
+        Download a set of task output files in parallel.
+        Each download is a blocking HTTP request, so dispatching them
+        through a thread pool overlaps the network round-trips.
+
+        :Args:
+            - outputs (list): A list of output dictionaries (as created by
+              :meth:`.list_outputs()`) to be downloaded.
+            - download_dir (str): Full path to the directory to download the
+              outputs to.
+
+        :Kwargs:
+            - overwrite (bool): Whether to overwrite existing files.
+              The default is ``False``.
+            - max_workers (int): The maximum number of concurrent downloads.
+              The default is 8.
+
+        :Returns:
+            - A list of tuples containing any outputs that failed to download
+              and the accompanying :exc:`.RestCallException`, in the format:
+              ``[(output, exception), (output, exception)..]``
+              If all outputs downloaded successfully this list will be empty.
+        """
+        _LOG.info("Downloading {0} task outputs with {1} "
+                       "workers".format(len(outputs), max_workers))
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            downloads = dict([(executor.submit(self._get_file,
+                                               output,
+                                               download_dir,
+                                               overwrite), output)
+                              for output in outputs])
+
+            for pending in as_completed(downloads):
+                try:
+                    download = pending.result()
+
+                except RestCallException as exp:
+                    failed.append((downloads[pending], exp))
+                    continue
+
+                if not download.success:
+                    failed.append((downloads[pending], download.result))
+
+        return failed
+
     def cancel(self):
         """
         Cancel the task.
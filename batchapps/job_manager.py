@@ -26,7 +26,8 @@
 #--------------------------------------------------------------------------
 
 import logging
-import multiprocessing
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .config import Configuration
 from .job import JobSubmission, SubmittedJob
@@ -34,6 +35,10 @@ from .api import BatchAppsApi
 from .utils import Listener
 from .exceptions import RestCallException
 
+# Shared module logger, resolved once rather than per JobManager instance.
+_LOG = logging.getLogger('batch_apps')
+
+
 class JobManager(object):
     """
     This is the only class that a user should need to import to access all
@@ -51,7 +56,6 @@ class JobManager(object):
             - cfg (:class:`.Configuration`): Configuration of the Batch Apps
               client session. If not set, a default config will be used.
        """
-        self._log = logging.getLogger('batch_apps')
         self._client = BatchAppsApi(
             credentials, cfg if cfg else Configuration())
         self.count = None
@@ -139,12 +143,11 @@ class JobManager(object):
             self.count = resp.result.get('totalCount', 0)
 
             try:
-                resp_jobs = [SubmittedJob(
-                    self._client,
-                    _job.pop('id'),
-                    _job.pop('name'),
-                    _job.pop('type'),
-                    **_job) for _job in resp.result['jobs']]
+                # Local alias keeps the per-job name lookup out of the
+                # module globals inside the comprehension.
+                from_raw = SubmittedJob.from_raw
+                resp_jobs = [from_raw(self._client, _job)
+                             for _job in resp.result['jobs']]
 
                 return resp_jobs
 
@@ -157,6 +160,49 @@ class JobManager(object):
         else:
             raise resp.result
 
+    def get_all_jobs(self, name=None, per_call=50, workers=8):
+        """
+        Get the complete list of the user's jobs.
+        The first page is fetched to learn the total job count, then the
+        remaining pages are fetched in parallel, overlapping the REST
+        round-trips rather than walking the pages one at a time.
+
+        :Kwargs:
+            - name (str): Only return jobs whose names contain this string.
+            - per_call (int): Number of jobs retrieved per request.
+              The default is 50.
+            - workers (int): The maximum number of concurrent page requests.
+              The default is 8.
+
+        :Returns:
+            - A list of :class:`.SubmittedJob` objects in listing order.
+
+        :Raises:
+            - :exc:`.RestCallException` if an error occurred during any of
+              the requests.
+        """
+        listing = {0: self.get_jobs(index=0, per_call=per_call, name=name)}
+
+        if self.count is None or self.count <= per_call:
+            return listing[0]
+
+        _LOG.debug("Fetching {0} remaining jobs with {1} "
+                        "workers".format(self.count - per_call, workers))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = dict([(executor.submit(
+                self.get_jobs, index, per_call, name), index)
+                for index in range(per_call, self.count, per_call)])
+
+            for pending in as_completed(pages):
+                listing[pages[pending]] = pending.result()
+
+        all_jobs = []
+        for index in sorted(listing):
+            all_jobs.extend(listing[index])
+
+        return all_jobs
+
     def create_job(self, name, **jobdetails):
         """Create a new job submission.
 
@@ -211,10 +257,10 @@ class JobManager(object):
         if not hasattr(submitjob, 'submit'):
             raise TypeError("Must submit a JobSubmission object.")
 
-        self._log.debug("Processing job: {0}".format(submitjob.name))
+        _LOG.debug("Processing job: {0}".format(submitjob.name))
 
         if submitjob.source not in submitjob.required_files:
-            self._log.warning("The job file for job {0} has not been included "
+            _LOG.warning("The job file for job {0} has not been included "
                               "in the required files list. "
                               "Consider revising.")
 
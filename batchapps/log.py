@@ -27,6 +27,14 @@
 
 import logging
 
+# One console handler per process. Unpickled loggers share this instead of
+# allocating a fresh StreamHandler and Formatter for every work item that
+# crosses a multiprocessing boundary.
+_CONSOLE_HANDLER = logging.StreamHandler()
+_CONSOLE_HANDLER.setFormatter(logging.Formatter(
+    "%(asctime)-15s [%(levelname)s] %(module)s: %(message)s"))
+
+
 class PickleLog(logging.getLoggerClass()):
     """PickleLog
 
@@ -37,35 +45,30 @@ class PickleLog(logging.getLoggerClass()):
     def __getstate__(self):
         """Serializing state of the logger.
 
-        Removes the stream logging handlers when pickling
+        Pickles only the logger name and level - everything else can be
+        rebuilt from the logging registry on the receiving side, keeping
+        the per-task IPC payload minimal.
 
         :Returns:
-            - The Logger dict with the 'handlers' key removed.
+            - A dict with the 'name' and 'level' of the logger.
         """
-        pick = dict(self.__dict__)
-        pick.pop('handlers')
-        return pick
+        return {'name': self.name, 'level': self.level}
 
     def __setstate__(self, state):
         """De-serialization state of the logger.
 
-        Reinstates the console stream handler, but not the file handler as
+        Rebuilds the logger from the receiving process's own registry and
+        attaches the shared console stream handler, but no file handler as
         this could create conflicts between subprocesses writing to the same
         file.
 
         :Args:
-            - state (dict): The logger state as resolved from deserilization
-              from which the logger will be rebuilt. The 'handlers' key
-              will be re-added before setting to the Logger.
+            - state (dict): The pickled 'name' and 'level' from which the
+              logger will be rebuilt.
         """
-        #TODO: Would be nice to fix this.
-        state['handlers'] = []
-
-        log_format = logging.Formatter(
-            "%(asctime)-15s [%(levelname)s] %(module)s: %(message)s")
-
-        console_logging = logging.StreamHandler()
-        console_logging.setFormatter(log_format)
+        template = logging.getLogger(state['name'])
 
-        state['handlers'].append(console_logging)
-        self.__dict__ = state
+        restored = dict(template.__dict__)
+        restored['level'] = state['level']
+        restored['handlers'] = [_CONSOLE_HANDLER]
+        self.__dict__ = restored
@@ -40,6 +40,7 @@ from oauthlib import oauth2
 
 import json
 import os
+import shutil
 import sys
 
 import logging
@@ -47,6 +48,14 @@ import logging
 LOG = logging.getLogger('batch_apps')
 RETRIES = 3
 
+# A single shared transport adapter. The OAuth session object is rebuilt
+# per call, but mounting this adapter on it means every request draws from
+# the same urllib3 connection pool, so TCP/TLS handshakes to the service
+# are amortized across calls instead of being paid on each one.
+_ADAPTER = requests.adapters.HTTPAdapter(max_retries=RETRIES,
+                                         pool_connections=16,
+                                         pool_maxsize=64)
+
 
 def _check_code(response):
 
@@ -94,8 +103,7 @@ def _call(auth, *args, **kwargs):
 
     try:
         conn_session = auth.get_session()
-        conn_adptr = requests.adapters.HTTPAdapter(max_retries=RETRIES)
-        conn_session.mount('https://', conn_adptr)
+        conn_session.mount('https://', _ADAPTER)
 
         LOG.info("About to make REST call with args {0}".format(args))
         LOG.debug("About to make REST call with kwargs {0}".format(kwargs))
@@ -115,8 +123,7 @@ def _call(auth, *args, **kwargs):
                                           "{0}".format(str(exp)))
 
         try:
-            conn_adptr = requests.adapters.HTTPAdapter(max_retries=RETRIES)
-            refreshed_session.mount('https://', conn_adptr)
+            refreshed_session.mount('https://', _ADAPTER)
             response = refreshed_session.request(*args, **kwargs)
             return _check_code(response)
 
@@ -348,7 +355,8 @@ def download(auth, url, headers, output_path, size, overwrite,
         - headers (dict): The headers to be used in the request.
         - output_path (str): Full file path to download the data to.
         - size (int): File size of the file to be downloaded as retrieved
-          by a HEAD request.
+          by a HEAD request. If ``None``, the size will be read from the
+          Content-Length header of the download response.
         - overwrite (bool): If ``True``, download the new data over an
           existing file.
 
@@ -390,15 +398,30 @@ def download(auth, url, headers, output_path, size, overwrite,
 
     LOG.info("Starting download to {0}".format(downloadfile))
 
-    if size > 0:
-        data_downloaded = float(0)
-
+    data_downloaded = float(0)
     use_callback = hasattr(callback, "__call__")
 
     try:
         with open(downloadfile, "wb") as handle:
             response = _call(auth, 'GET', url, headers=headers, stream=True)
 
+            if size is None:
+                # No pre-flight HEAD request was made, so resolve the file
+                # size from the response for progress reporting.
+                size = int(response.headers.get('content-length', 0))
+
+            if not use_callback:
+                # No progress reporting needed, so stream the body straight
+                # to the file without the per-block Python loop. This is as
+                # close to zero-copy as the client can get: an os.sendfile
+                # path is off the table because the service only speaks
+                # HTTPS, and TLS payloads have to be decrypted in userspace.
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, handle, block_size)
+
+                LOG.info("Download complete")
+                return response
+
             for block in response.iter_content(block_size):
                 if not block:
                     LOG.info("Download complete")
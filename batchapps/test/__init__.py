@@ -28,44 +28,42 @@
 Batch Apps Python Client Unit Test Suite
 """
 
-import sys
-import os
 
-if sys.version_info[:2] < (2, 7, ):
-    try:
-        import unittest2
-        from unittest2 import TestLoader, TextTestRunner
+def run_unit_tests():
+    """Discover and run the unit test suite.
 
-    except ImportError:
-        raise ImportError("The BatchApps Python Client test suite requires "
-                          "the unittest2 package to run on Python 2.6 and "
-                          "below.\nPlease install this package to continue.")
-else:
-    import unittest
-    from unittest import TestLoader, TextTestRunner
+    The test-framework imports are resolved here rather than at module
+    load, so that importing :mod:`batchapps.test` (e.g. during package
+    or test discovery) does not pay for unittest, mock or the TeamCity
+    runner until the suite is actually run.
 
-if sys.version_info[:2] >= (3, 3, ):
-    from unittest import mock
-else:
-    try:
-        import mock
+    :Returns:
+        - The :class:`unittest.TestResult` of the run.
+    """
+    import os
+    import sys
 
-    except ImportError:
-        raise ImportError("The BatchApps Python Client test suite requires "
-                          "the mock package to run on Python 3.2 and below.\n"
-                          "Please install this package to continue.")
+    if sys.version_info[:2] < (2, 7, ):
+        try:
+            from unittest2 import TestLoader, TextTestRunner
 
-try:
-    from teamcity import is_running_under_teamcity
-    from teamcity.unittestpy import TeamcityTestRunner
-    TC_BUILD = is_running_under_teamcity()
+        except ImportError:
+            raise ImportError("The BatchApps Python Client test suite "
+                              "requires the unittest2 package to run on "
+                              "Python 2.6 and below.\nPlease install this "
+                              "package to continue.")
+    else:
+        from unittest import TestLoader, TextTestRunner
 
-except ImportError:
-    TC_BUILD = False
+    try:
+        from teamcity import is_running_under_teamcity
+        from teamcity.unittestpy import TeamcityTestRunner
+        tc_build = is_running_under_teamcity()
 
-if __name__ == '__main__':
+    except ImportError:
+        tc_build = False
 
-    if TC_BUILD:
+    if tc_build:
         runner = TeamcityTestRunner()
     else:
         runner = TextTestRunner(verbosity=2)
@@ -76,4 +74,8 @@ if __name__ == '__main__':
     suite = test_loader.discover(test_dir,
                                  pattern="unittest_*.py",
                                  top_level_dir=top_dir)
-    runner.run(suite)
+    return runner.run(suite)
+
+
+if __name__ == '__main__':
+    run_unit_tests()
@@ -26,19 +26,8 @@
 #--------------------------------------------------------------------------
 """Unit tests for Credentials and AzureOAuth"""
 
-import sys
+from batchapps.test._compat import mock, unittest
 
-try:
-    import unittest2 as unittest
-except ImportError:
-    import unittest
-
-try:
-    from unittest import mock
-except ImportError:
-    import mock
-
-import requests_oauthlib
 import logging
 
 from batchapps import (
@@ -52,6 +41,70 @@ from batchapps.exceptions import (
     InvalidConfigException)
 
 
+_TOKEN = {'token_type': '1', 'access_token': '2'}
+_TOKEN_REPR = str(_TOKEN)
+
+# The AAD config dicts the mocked Configuration hands back, hoisted from
+# the test bodies. Tests that mutate the returned dict take a copy.
+_AAD_AUTH_URL = {'auth_uri': '1', 'resource': '2', 'root': '3', 'tenant': '4'}
+_AAD_TOKEN = {'root': '1/',
+              'unattended_key': '3',
+              'token_uri': '/auth',
+              'resource': 'test',
+              'tenant': 'common',
+              'client_id': 'abc'}
+_AAD_UNATTENDED = {'root': '1/',
+                   'unattended_key': '3',
+                   'token_uri': '/auth',
+                   'resource': 'test',
+                   'unattended_account': 'abc'}
+_AAD_UNATTENDED_FULL = {'root': 'http://1/',
+                        'unattended_key': '3',
+                        'token_uri': '/auth',
+                        'resource': 'https://test',
+                        'unattended_account': 'ClientID=abc;TenantID=common'}
+_CREDS_AUTH = {'root': '1/',
+               'unattended_key': '3',
+               'token_uri': '/auth',
+               'resource': 'https://test',
+               'tenant': 'common',
+               'client_id': 'abc'}
+
+# Credentials stand-ins log through this instead of the root logger, so
+# test output stays clean and no root handlers run on the test path.
+_NULL_LOG = logging.getLogger('batch_apps.test.null')
+_NULL_LOG.addHandler(logging.NullHandler())
+_NULL_LOG.propagate = False
+
+
+class _OAuthSessionStub(object):
+    """Stand-in for requests_oauthlib.OAuth2Session.
+
+    Autospeccing the real class walks the whole requests.Session MRO;
+    the code under test only ever touches these three attributes.
+    """
+
+    def __init__(self):
+        self.authorization_url = mock.Mock()
+        self.fetch_token = mock.Mock()
+        self.token = {}
+
+
+def _make_creds(**attrs):
+    """Build a cheap Credentials stand-in for calling unbound methods on.
+
+    ``mock.create_autospec(Credentials)`` re-inspects the whole class per
+    call; the tests only ever touch a few attributes, so a plain Mock
+    preloaded with them does the same job at a fraction of the cost.
+    """
+    creds = mock.Mock()
+    creds._log = _NULL_LOG
+    creds._id = 'test'
+    for key, value in attrs.items():
+        setattr(creds, key, value)
+    return creds
+
+
 # pylint: disable=W0212
 class TestAzureOAuth(unittest.TestCase):
     """Unit tests for AzureOAuth"""
@@ -60,6 +113,17 @@ class TestAzureOAuth(unittest.TestCase):
 
         credentials.VERIFY = True
         credentials.CA_CERT = None
+
+        # Configuration and Credentials are patched for every test in this
+        # class; starting the patchers here once is cheaper than stacking
+        # the same decorators on each method.
+        patcher = mock.patch('batchapps.credentials.Configuration')
+        self.mock_config = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch('batchapps.credentials.Credentials')
+        self.mock_creds = patcher.start()
+        self.addCleanup(patcher.stop)
         return super(TestAzureOAuth, self).setUp()
 
     def test_azureoauth_check_state(self):
@@ -92,36 +156,33 @@ class TestAzureOAuth(unittest.TestCase):
                                                        redirect_uri="http://1",
                                                        state='test')
 
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.credentials.Configuration')
-    def test_azureoauth_get_session(self, mock_config, mock_credentials):
+    def test_azureoauth_get_session(self):
         """Test get_session"""
 
+        mock_config = self.mock_config
         mock_config.return_value = mock.create_autospec(Configuration)
         mock_config.return_value.aad_config.return_value = {'client_id':'abc'}
         AzureOAuth.get_session()
         self.assertTrue(mock_config.called)
-        mock_credentials.assert_called_with(mock_config.return_value, 'abc')
+        self.mock_creds.assert_called_with(mock_config.return_value, 'abc')
         mock_config.reset_mock()
 
         mock_cfg = mock.create_autospec(Configuration)
         mock_cfg.aad_config.return_value = {'client_id':'abc'}
         AzureOAuth.get_session(config=mock_cfg)
         self.assertFalse(mock_config.called)
-        mock_credentials.assert_called_with(mock_cfg, 'abc')
+        self.mock_creds.assert_called_with(mock_cfg, 'abc')
 
-    @mock.patch('batchapps.credentials.Configuration')
     @mock.patch.object(AzureOAuth, '_setup_session')
     @mock.patch.object(credentials.requests_oauthlib.oauth2_session, 'generate_token')
-    def test_azureoauth_get_authorization_url(self, mock_gen, mock_setup, mock_config):
+    def test_azureoauth_get_authorization_url(self, mock_gen, mock_setup):
         """Test get_authorization_url"""
 
+        mock_config = self.mock_config
         mock_gen.return_value = "gen_state_123"
-        mock_setup.return_value = mock.create_autospec(
-            requests_oauthlib.OAuth2Session)
+        mock_setup.return_value = _OAuthSessionStub()
 
-        mock_config.return_value.aad_config.return_value = {'auth_uri':'1', 'resource':'2', 'root':'3',
-                                                            'tenant':'4'}
+        mock_config.return_value.aad_config.return_value = _AAD_AUTH_URL
         with self.assertRaises(AuthenticationException):
             AzureOAuth.get_authorization_url()
 
@@ -147,26 +208,18 @@ class TestAzureOAuth(unittest.TestCase):
                                                                      domain_hint='live.com')
 
 
-    @mock.patch('batchapps.credentials.Configuration')
     @mock.patch.object(AzureOAuth, '_setup_session')
     @mock.patch.object(AzureOAuth, '_check_state')
-    @mock.patch('batchapps.credentials.Credentials')
-    def test_azureoauth_get_authorization_token(self,
-                                     mock_creds, mock_state,
-                                     mock_setup, mock_config):
+    def test_azureoauth_get_authorization_token(self, mock_state, mock_setup):
         """Test get_authorization_token"""
 
+        mock_config = self.mock_config
+        mock_creds = self.mock_creds
         mock_state.return_value = True
-        mock_setup.return_value = mock.create_autospec(
-            requests_oauthlib.OAuth2Session)
+        mock_setup.return_value = _OAuthSessionStub()
         mock_setup.return_value.fetch_token.return_value = {}
 
-        mock_config.return_value.aad_config.return_value = {'root':'1/',
-                                               'unattended_key':'3',
-                                               'token_uri':'/auth',
-                                               'resource':'test',
-                                               'tenant':'common',
-                                               'client_id':'abc'}
+        mock_config.return_value.aad_config.return_value = _AAD_TOKEN
 
         with self.assertRaises(InvalidConfigException):
             AzureOAuth.get_authorization_token("test", config="test")
@@ -213,26 +266,19 @@ class TestAzureOAuth(unittest.TestCase):
         AzureOAuth.get_principal_token(config="world")
         mock_token.assert_called_with(config="world")
 
-    @mock.patch('batchapps.credentials.requests_oauthlib')
-    @mock.patch('batchapps.credentials.BackendApplicationClient')
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    def test_azureoauth_get_unattended_session(self,
-                                 mock_creds,
-                                 mock_config,
-                                 mock_client,
-                                 mock_req):
+    @mock.patch.multiple('batchapps.credentials',
+                         requests_oauthlib=mock.DEFAULT,
+                         BackendApplicationClient=mock.DEFAULT)
+    def test_azureoauth_get_unattended_session(self, **mocks):
         """Test get_unattended_session"""
 
-        mock_session = mock.create_autospec(
-            requests_oauthlib.OAuth2Session)
+        mock_req = mocks['requests_oauthlib']
+        mock_client = mocks['BackendApplicationClient']
+        mock_config = self.mock_config
+        mock_session = _OAuthSessionStub()
 
         mock_req.OAuth2Session.return_value = mock_session
-        mock_config.aad_config.return_value = {'root':'1/',
-                                               'unattended_key':'3',
-                                               'token_uri':'/auth',
-                                               'resource':'test',
-                                               'unattended_account':'abc'}
+        mock_config.aad_config.return_value = dict(_AAD_UNATTENDED)
 
         with self.assertRaises(InvalidConfigException):
             AzureOAuth.get_unattended_session(mock_config)
@@ -249,11 +295,7 @@ class TestAzureOAuth(unittest.TestCase):
             response_type='client_credentials',
             verify=True)
 
-        mock_config.aad_config.return_value = {'root':'http://1/',
-                                               'unattended_key':'3',
-                                               'token_uri':'/auth',
-                                               'resource':'https://test',
-                                               'unattended_account':'ClientID=abc;TenantID=common'}
+        mock_config.aad_config.return_value = _AAD_UNATTENDED_FULL
 
         AzureOAuth.get_unattended_session(mock_config)
         mock_client.assert_called_with("abc")
@@ -333,24 +375,18 @@ class TestCredentials(unittest.TestCase):
     def test_credentials_store_auth(self, mock_keyring):
         """Test store_auth"""
 
-        creds = mock.create_autospec(Credentials)
-        creds._log = logging.getLogger()
-        creds._id = 'test'
-        Credentials.store_auth(creds, {'token_type':'1',
-                                       'access_token':'2'})
+        creds = _make_creds()
+        Credentials.store_auth(creds, _TOKEN)
 
         mock_keyring.set_password.assert_called_with("AzureBatchApps",
                                                      "test",
-                                                     str({'token_type':'1',
-                                                          'access_token':'2'}))
+                                                     _TOKEN_REPR)
 
     @mock.patch('batchapps.credentials.keyring')
     def test_credentials_clear_auth(self, mock_keyring):
         """Test clear_auth"""
 
-        creds = mock.create_autospec(Credentials)
-        creds._log = logging.getLogger()
-        creds._id = 'test'
+        creds = _make_creds()
         Credentials.clear_auth(creds)
 
         mock_keyring.delete_password.assert_called_with("AzureBatchApps",
@@ -360,9 +396,7 @@ class TestCredentials(unittest.TestCase):
     def test_credentials_get_stored_auth(self, mock_keyring):
         """Test get_stored_auth"""
 
-        creds = mock.create_autospec(Credentials)
-        creds._log = logging.getLogger()
-        creds._id = 'test'
+        creds = _make_creds()
         mock_keyring.get_password.return_value = None
 
         with self.assertRaises(AuthenticationException):
@@ -370,8 +404,7 @@ class TestCredentials(unittest.TestCase):
         mock_keyring.get_password.assert_called_with("AzureBatchApps",
                                                      "test")
 
-        mock_keyring.get_password.return_value = str({'token_type':'1',
-                                                      'access_token':'2'})
+        mock_keyring.get_password.return_value = _TOKEN_REPR
         Credentials.get_stored_auth(creds)
         mock_keyring.get_password.assert_called_with("AzureBatchApps", "test")
 
@@ -379,18 +412,11 @@ class TestCredentials(unittest.TestCase):
     def test_credentials_get_session(self, mock_requests):
         """Test get_session"""
 
-        creds = mock.create_autospec(Credentials)
-        creds._id = 'abc'
-        creds.auth = {'root':'1/',
-                     'unattended_key':'3',
-                     'token_uri':'/auth',
-                     'resource':'https://test',
-                     'tenant':'common',
-                     'client_id':'abc'}
+        creds = _make_creds(_id='abc')
+        creds.auth = _CREDS_AUTH
         creds.token = {'expires_at':'1',
                        'expires_in':'2',
                        'refresh_token':"test"}
-        creds._log = logging.getLogger()
 
         Credentials.get_session(creds)
         mock_requests.OAuth2Session.assert_called_with(
@@ -409,18 +435,11 @@ class TestCredentials(unittest.TestCase):
     @mock.patch('batchapps.credentials.requests_oauthlib')
     def test_credentials_refresh_session(self, mock_req, mock_oauth):
 
-        creds = mock.create_autospec(Credentials)
-        creds._id = 'abc'
-        creds.auth = {'root':'1/',
-                     'unattended_key':'3',
-                     'token_uri':'/auth',
-                     'resource':'https://test',
-                     'tenant':'common',
-                     'client_id':'abc'}
+        creds = _make_creds(_id='abc')
+        creds.auth = _CREDS_AUTH
         creds.token = {'expires_at':'1',
                        'expires_in':'2',
                        'refresh_token':"test"}
-        creds._log = logging.getLogger()
 
         Credentials.refresh_session(creds)
 
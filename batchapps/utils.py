@@ -26,7 +26,6 @@
 #--------------------------------------------------------------------------
 """Batch Apps Client Utility Module"""
 
-import re
 import urllib
 import sys
 import traceback
@@ -43,6 +42,16 @@ except ImportError:
 import logging
 LOG = logging.getLogger('batch_apps')
 
+# Table deleting everything but the decimal digits 0-9 from an ASCII
+# timestamp in one C-level pass, version independent. An explicit digit
+# set rather than isdigit(), so characters like the superscript
+# chr(178) are stripped just as the old regex stripped them.
+_NON_DIGITS = ''.join(c for c in map(chr, range(256)) if c not in '0123456789')
+try:
+    _DATE_TRANS = str.maketrans('', '', _NON_DIGITS)
+except AttributeError:
+    _DATE_TRANS = None
+
 def parse_date_string(time_string):
     """Format datetime string into an easily comparable and REST happy form.
 
@@ -52,11 +61,17 @@ def parse_date_string(time_string):
     :Returns:
         The string formatted for use with the REST API (str).
     """
-    formatted = ''.join(re.findall('\\d+', time_string)) + "000000"
-    LOG.debug("Parsed date string {in_t} to "
-              "{out_t}".format(in_t=time_string, out_t=formatted[0:17]))
+    if _DATE_TRANS:
+        digits = time_string.translate(_DATE_TRANS)
+    else:
+        digits = time_string.translate(None, _NON_DIGITS)
+
+    formatted = (digits + "000000")[0:17]
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("Parsed date string {in_t} to "
+                  "{out_t}".format(in_t=time_string, out_t=formatted))
 
-    return formatted[0:17]
+    return formatted
 
 def url_from_filename(filename):
     """
@@ -81,12 +96,14 @@ def filename_from_url(url, ext):
     :Returns:
         - A valid filename.
     """
-    alt = urlsplit(url)
-    url_file = alt.path.rpartition('/')[2]
-    filename = urlunquote(url_file)
+    path = urlsplit(url).path
+    slash = path.rfind('/')
+    url_file = path[slash + 1:] if slash >= 0 else path
+    filename = urlunquote(url_file) if '%' in url_file else url_file
 
-    LOG.debug("Filename {fn} with extension {ex} from URL "
-              "{ur}".format(fn=filename, ex=ext, ur=url))
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("Filename {fn} with extension {ex} from URL "
+                  "{ur}".format(fn=filename, ex=ext, ur=url))
 
     return (filename + ext) if ext else filename
 
@@ -101,7 +118,7 @@ def format_dictionary(dictionary):
         - REST list in the format
             [ {'Name':'parameter}, {'Value':'value'} ]
     """
-    return ({"Name": str(k), "Value": str(v)} for k, v in dictionary.items())
+    return [{"Name": str(k), "Value": str(v)} for k, v in dictionary.items()]
 
 def valid_keys(resp_dict, search_keys):
     '''
@@ -119,13 +136,27 @@ def valid_keys(resp_dict, search_keys):
     if not isinstance(resp_dict, dict):
         return False
 
-    try:
-        overlap = list(list(resp_dict) & set(search_keys))
-        return len(overlap) == len(search_keys)
+    return all(key in resp_dict for key in search_keys)
+
+class _LazyTrace(object):
+    """Deferred traceback formatter.
+
+    Renders the trace only when interpolated into a message, so handing
+    it to a disabled ``LOG.debug`` call costs nothing; source line
+    lookup is skipped as the output is only for debug logs.
+    """
+
+    def __init__(self, excep):
+        self.excep = excep
+
+    def __str__(self):
+        try:
+            trace = traceback.TracebackException.from_exception(
+                self.excep, lookup_lines=False)
+            return ''.join(trace.format())
 
-    except TypeError:
-        matching_keys = set(search_keys).intersection(list(resp_dict))
-        return len(list(matching_keys)) == len(search_keys)
+        except AttributeError:
+            return str(traceback.format_exc())
 
 def get_trace(excep):
     """Retrieve an exception traceback
@@ -134,11 +165,10 @@ def get_trace(excep):
         - excep (:class:`Exception`): The exception that was thrown.
 
     :Returns:
-        The traceback information (str).
+        The traceback information, rendered to ``str`` on demand.
     """
     try:
-        trace = traceback.format_exc()
-        return trace
+        return _LazyTrace(excep)
     except AttributeError:
         return None
 
@@ -164,23 +194,24 @@ class Listener(object):
                 stopped before the parent process is stopped.
         """
         self._proc = process
-        self.pid = self._proc.pid
         self.name = self._proc.name
         self.children = list(child)
 
+    @property
+    def pid(self):
+        """The process pid, read straight off the wrapped process."""
+        return self._proc.pid
+
     def working(self):
         """Check if the background process is still running.
 
         :Returns:
             ``True`` if the process is still running, else ``False``.
         """
-        self.pid = self._proc.pid
         return self._proc.is_alive()
 
     def stop(self):
         """Terminate the background process"""
-        self.pid = self._proc.pid
-
         try:
             for child in self.children:
                 child.stop()